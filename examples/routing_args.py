@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+"""Measure the cost of reading request.args and request.kwargs for a POST carrying a 1 MB form body.
+
+"before" recomputes the routing arguments on every access, as happened prior to them being stored in the environment;
+"after" reads the descriptors, which compute them once and reuse the stored wsgiorg.routing_args value.
+"""
+
+from __future__ import unicode_literals, print_function
+
+from timeit import repeat
+
+from marrow.util.compat import IO
+
+from marrow.wsgi.objects.adapters.args import _args_kwargs_default
+from marrow.wsgi.objects.request import Request, LocalRequest
+
+
+ENVIRON = LocalRequest(path='/foo/bar/baz?page=2', POST=[('field%d' % i, 'x' * 1000) for i in range(1000)]).environ
+BODY = ENVIRON['wsgi.input'].getvalue()  # Approximately 1 MB.
+READS = 2  # args, then kwargs.
+
+
+def new():
+    environ = dict(ENVIRON)
+    environ['wsgi.input'] = IO(BODY)
+    return Request(environ)
+
+
+def before():
+    request = new()
+    
+    for i in range(READS):
+        request.environ.pop('marrow.wsgi.objects.form', None)  # The body used to be re-parsed, too.
+        request['wsgi.input'].seek(0)
+        _args_kwargs_default(Request.args, request)
+        del request['wsgiorg.routing_args']
+
+
+def after():
+    request = new()
+    request.args
+    request.kwargs
+
+
+if __name__ == '__main__':
+    for fn in (before, after):
+        best = min(repeat(fn, number=20, repeat=5)) / 20
+        print("%-6s %8.3f ms per request" % (fn.__name__, best * 1000))
@@ -4,12 +4,103 @@
 
 from __future__ import unicode_literals
 
-from marrow.util.compat import bytestring, unicode
+import re
+import json
+
+from string import Formatter
+
+try:
+    from html import escape
+except ImportError:  # pragma: no cover
+    from cgi import escape
+
+from marrow.util.compat import binary, bytestring, unicode, unicodestr
 
 
 __all__ = []
 
 
+RENDER_CACHE_LIMIT = 1024  # Distinct rendered error bodies (and Accept headers) remembered before the cache is emptied.
+FIELD_RE = re.compile(r'[.\[]')
+
+_fields = dict()  # Explanation to the tuple of environ keys it references.
+_rendered = dict()  # (class, template, explanation, detail, media type, environ values) to rendered body.
+_negotiated = dict()  # Accept header value to the preferred error body media type.
+
+
+
+def placeholders(text):
+    """Return the names of the environ keys referenced by replacement fields in the given format string."""
+    
+    try:
+        return _fields[text]
+    except KeyError:
+        pass
+    
+    names = tuple(sorted(set(FIELD_RE.split(name, 1)[0] for literal, name, spec, conversion in Formatter().parse(text) if name)))
+    
+    if len(_fields) >= RENDER_CACHE_LIMIT:
+        _fields.clear()
+    
+    _fields[text] = names
+    return names
+
+
+def negotiate(accept, offers=('text/html', 'application/json', 'text/plain')):
+    """Select the offered media type most preferred by an Accept header value, favouring earlier offers on a tie.
+    
+    The first offer is used if there is no Accept header or nothing offered is acceptable.
+    """
+    
+    if not accept:
+        return offers[0]
+    
+    key = (accept, offers)
+    
+    try:
+        return _negotiated[key]
+    except KeyError:
+        pass
+    
+    ranges = []
+    
+    for item in unicodestr(accept, 'ascii').split(','):
+        mime, _, params = item.partition(';')
+        mime = mime.strip().lower()
+        quality = 1.0
+        
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        ranges.append((mime, quality))
+    
+    best, preferred = offers[0], 0.0
+    
+    for offer in offers:
+        major = offer.partition('/')[0] + '/*'
+        specificity, quality = -1, 0.0
+        
+        for mime, q in ranges:
+            rank = 2 if mime == offer else 1 if mime == major else 0 if mime == '*/*' else -1
+            
+            if rank > specificity:
+                specificity, quality = rank, q
+        
+        if quality > preferred:
+            best, preferred = offer, quality
+    
+    if len(_negotiated) >= RENDER_CACHE_LIMIT:
+        _negotiated.clear()
+    
+    _negotiated[key] = best
+    return best
+
 
 class HTTPException(Exception):
     def __init__(self, headers=None, body=None):
@@ -17,17 +108,25 @@ class HTTPException(Exception):
         self.body = body
     
     def __call__(self, environ, start_response=None):
-        code = bytestring(str(self.code), 'ascii')
-        status = self.status
+        return self._deliver(self.headers, self.body, start_response)
+    
+    def _deliver(self, headers, body, start_response):
+        status = bytestring(str(self.code), 'ascii') + b' ' + bytestring(self.status, 'ascii')
         
         if start_response:
-            start_response(code + b' ' + status, self.headers)
-            return [self.body]
+            start_response(status, headers)
+            return [body or b""]
         
-        return code + b' ' + status, self.headers, [self.body or b""]
+        return status, headers, [body or b""]
 
 
 class HTTPError(HTTPException):
+    """The base class of HTTP error responses.
+    
+    Unless given an explicit body, errors render an HTML, JSON, or plain text body, whichever the client's Accept header
+    prefers, delivered with Content-Type, Content-Length, and Vary headers.
+    """
+    
     template = '''<html>
 <head><title>{code} {status}</title></head>
 <body>
@@ -38,26 +137,102 @@ class HTTPError(HTTPException):
 </html>
 '''
     
+    text_template = '''{code} {status}
+
+{explanation}
+
+{detail}
+'''
+    
+    formats = {
+            'text/html': b'text/html; charset=iso-8859-1',
+            'application/json': b'application/json',
+            'text/plain': b'text/plain; charset=utf-8',
+        }
+    
+    explanation = ''
+    detail = ''
+    
     def __init__(self, explanation='', detail=''):
-        super(HTTPError, self).__init__([
-                (b'Content-Type', b'text/html; charset=iso-8859-1')
-            ])
+        super(HTTPError, self).__init__()
+        
+        if explanation:
+            self.explanation = explanation
         
-        self.explanation = explanation
-        self.detail = detail
+        if detail:
+            self.detail = detail
     
     def __call__(self, environ, start_response=None):
-        if self.template and not self.body:
-            vars = dict([(k, v) for k, v in environ.items()])
-            explanation = self.explanation.format(**vars)
-            self.body = self.template.format(
-                    code = self.code,
-                    status = unicode(self.status, 'ascii'),
-                    explanation = explanation,
-                    detail = self.detail
-                ).encode('iso-8859-1')
+        if self.body or not self.template:
+            headers = [(b'Content-Type', self.formats['text/html'])] + self.headers
+            return self._deliver(headers, self.body, start_response)
         
-        return super(HTTPError, self).__call__(environ, start_response)
+        mime = negotiate(environ.get('HTTP_ACCEPT', None))
+        body = self.render(environ, mime)
+        
+        headers = [
+                (b'Content-Type', self.formats[mime]),
+                (b'Content-Length', str(len(body)).encode('ascii')),
+                (b'Vary', b'Accept')
+            ]
+        headers.extend(self.headers)
+        
+        return self._deliver(headers, body, start_response)
+    
+    def render(self, environ, mime='text/html'):
+        """Render the body of the given media type for the given environ.
+        
+        Only the environ keys referenced by the explanation are read, and the result is cached by class, template,
+        explanation, detail, media type, and the values of those keys, so repeated errors cost little more than a
+        dictionary lookup.
+        
+        The environ values and detail are client or caller supplied, so are escaped before inclusion in HTML.
+        """
+        
+        explanation = self.explanation
+        fields = placeholders(explanation)
+        values = tuple(environ.get(name, '') for name in fields)
+        key = (self.__class__, self.template, explanation, self.detail, mime, values)
+        
+        try:
+            return _rendered[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable environ values can not be cached.
+            key = None
+        
+        markup = mime not in ('application/json', 'text/plain')
+        detail = self.detail
+        
+        if fields:
+            text = [(unicodestr(i) if isinstance(i, binary) else unicode(i)) for i in values]
+            
+            if markup:
+                text = [escape(i, True) for i in text]
+            
+            explanation = explanation.format(**dict(zip(fields, text)))
+        
+        if markup and detail:
+            detail = escape(unicodestr(detail) if isinstance(detail, binary) else unicode(detail), True)
+        
+        data = dict(code=self.code, status=unicodestr(self.status, 'ascii'), explanation=explanation, detail=detail)
+        
+        if mime == 'application/json':
+            body = json.dumps(data, sort_keys=True).encode('ascii')
+        
+        elif mime == 'text/plain':
+            body = self.text_template.format(**data).encode('utf-8')
+        
+        else:
+            body = self.template.format(**data).encode('iso-8859-1', 'xmlcharrefreplace')
+        
+        if key is not None:
+            if len(_rendered) >= RENDER_CACHE_LIMIT:
+                _rendered.clear()
+            
+            _rendered[key] = body
+        
+        return body
     
     def __str__(self):
         return self.detail or self.explanation or repr(self)
@@ -916,3 +1091,31 @@ class HTTPInsufficientStorage(HTTPServerError, WebDAVException):
     code = 507
     status = b'Insufficient Storage'
     explanation = 'There was not enough space to save the resource.'
+
+
+
+# Lookup by numeric status code.
+
+def _subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        
+        for i in _subclasses(subclass):
+            yield i
+
+
+codes = dict((cls.code, cls) for cls in _subclasses(HTTPException) if 'code' in cls.__dict__)
+
+
+def abort(code, *args, **kw):
+    """Raise the HTTPException subclass for the given numeric status code, constructed using the remaining arguments.
+    
+    For example, abort(404) or abort(302, '/login').
+    """
+    
+    try:
+        cls = codes[code]
+    except KeyError:
+        raise ValueError("Unknown HTTP status code: " + unicode(code))
+    
+    raise cls(*args, **kw)
@@ -1,4 +1,41 @@
 # encoding: utf-8
 
-from marrow.wsgi.objects.request import Request, LocalRequest
-from marrow.wsgi.objects.response import Response
+"""Request and response objects for WSGI applications.
+
+The classes exported here are imported on first access, so importing this package, or any one of its submodules,
+does not pay for the rest.
+"""
+
+import sys
+
+
+__all__ = ['Request', 'LocalRequest', 'Response', 'wsgify', 'Router']
+
+
+_lazy = dict(  # Exported name to the module defining it.
+        Request = 'marrow.wsgi.objects.request',
+        LocalRequest = 'marrow.wsgi.objects.request',
+        Response = 'marrow.wsgi.objects.response',
+        wsgify = 'marrow.wsgi.objects.decorator',
+        Router = 'marrow.wsgi.objects.routing',
+    )
+
+
+
+def __getattr__(name):
+    try:
+        module = _lazy[name]
+    except KeyError:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    
+    value = globals()[name] = getattr(__import__(module, fromlist=(name, )), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover; module-level __getattr__ is unsupported, so import eagerly.
+    for _name in _lazy:
+        __getattr__(_name)
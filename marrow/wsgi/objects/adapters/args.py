@@ -1,34 +1,95 @@
 # encoding: utf-8
 
 try:
-    from urllib.parse import parse_qsl
+    from urllib.parse import parse_qsl, urlencode
 except ImportError:
+    from urllib import urlencode
     from urlparse import parse_qsl as parse_qsl_
     parse_qsl = lambda qs, keep_blank_values, strict_parsing, encoding: \
             [(k.decode(encoding, 'replace'), v.decode(encoding, 'replace')) for k, v in parse_qsl_(qs, keep_blank_values, strict_parsing)]
 
 from marrow.util.bunch import MultiBunch
+from marrow.util.compat import basestring, binary
 
 from marrow.wsgi.objects.path import Path as PathObj
-from marrow.wsgi.objects.adapters.base import ReaderWriter
+from marrow.wsgi.objects.query import Query as QueryObj
+from marrow.wsgi.objects.adapters.base import ReaderWriter, cached
 
 
-__all__ = ['Path', 'RoutingArgs', 'RoutingKwargs']
+__all__ = ['Path', 'Query', 'RoutingArgs', 'RoutingKwargs']
 
 
 class Path(ReaderWriter):
+    """Return the value of a path variable (SCRIPT_NAME or PATH_INFO) as a Path instance.
+
+    The parsed Path is kept in the environment for as long as the raw value is unchanged, whether or not the object
+    opts in to memoization, as paths are read repeatedly during routing.  Repeated reads only return an O(1) copy
+    sharing its component tuple and rendered string; changes made to that copy are local to it until it is assigned
+    back.
+    """
+
+    def _parse(self, obj, cls):
+        path = PathObj(super(Path, self).__get__(obj, cls))
+        path.__unicode__()  # Render once; copies share the result until they are changed.
+        return path
+
     def __get__(self, obj, cls):
-        return PathObj(super(Path, self).__get__(obj, cls))
+        if obj is None:
+            return self
+
+        return cached(self, obj, cls, Path._parse).copy()
 
     def __set__(self, obj, value):
         super(Path, self).__set__(obj, str(value))
 
-    def __del__(self, obj):
+    def __delete__(self, obj):
         super(Path, self).__set__(obj, '')
 
 
+class Query(ReaderWriter):
+    """Return a lazily decoded, multi-valued view of the query string.
+
+    The view is kept in the environment and reused for as long as the query string is unchanged, so values decoded once
+    stay decoded for the remainder of the request.  Assign a mapping or list of pairs to replace the query string.
+    """
+
+    view = 'marrow.wsgi.objects.query'
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+
+        source = super(Query, self).__get__(obj, cls)
+
+        try:
+            view = obj[self.view]
+        except KeyError:
+            view = None
+
+        if view is None or (view.source is not source and view.source != source):
+            view = obj[self.view] = QueryObj(source, getattr(obj, 'charset', None) or 'utf-8')
+
+        return view
+
+    def __set__(self, obj, value):
+        if isinstance(value, QueryObj):
+            value = value.source
+
+        elif value is not None and not isinstance(value, (basestring, binary)):
+            value = urlencode(list(value.items()) if hasattr(value, 'items') else list(value), True)
+
+        super(Query, self).__set__(obj, value)
+
+    def __delete__(self, obj):
+        super(Query, self).__set__(obj, '')
+
+
 def _args_kwargs_default(self, obj):
-    """Parse PATH_INFO, the response body, and QUERY_STRING to produce args and kwargs."""
+    """Parse PATH_INFO, the response body, and QUERY_STRING to produce args and kwargs.
+
+    The result is stored in the environment so that it is only computed once per request, whichever of args or kwargs is
+    accessed first, and is visible to downstream consumers of wsgiorg.routing_args.
+    """
 
     args = tuple(obj.remainder)
     kwargs = MultiBunch()
@@ -36,16 +97,20 @@ def _args_kwargs_default(self, obj):
     encoding = obj.charset or "utf-8"
 
     kwargs.update(parse_qsl(obj.parameters, True, False, encoding))
-    kwargs.update(parse_qsl(obj.query, True, False, encoding))
 
-    # TODO: THIS IS INSECURE AND BAD AND FULL OF BADNESS
-    # But cgi.FieldStorage sucks zombies.
-    if obj.method in ('POST', 'PUT') and obj.mime in ('', None, 'application/x-www-form-urlencoded'):  # , 'multipart/form-data'
-        print("ADA")
-        obj.body.seek(0)
-        kwargs.update(parse_qsl(obj.body.read().decode(encoding), True, False, encoding))
+    query = obj.params
+
+    for name in query:
+        for value in query.getall(name):
+            kwargs[name] = value
 
-    return (args, kwargs)
+    # The body is decoded incrementally, bounded by CONTENT_LENGTH and the request's _body_limit and _body_field_limit.
+    for name, value in obj.form.items():
+        for value in (value if isinstance(value, list) else (value, )):
+            kwargs[name] = value
+
+    result = obj[self.header] = (args, kwargs)
+    return result
 
 
 class RoutingArgs(ReaderWriter):
@@ -57,6 +122,9 @@ class RoutingArgs(ReaderWriter):
     default = _args_kwargs_default
 
     def __get__(self, obj, cls):
+        if obj is None:
+            return self
+
         return super(RoutingArgs, self).__get__(obj, cls)[0]
 
     def __set__(self, obj, value):
@@ -80,6 +148,9 @@ class RoutingKwargs(ReaderWriter):
     default = _args_kwargs_default
 
     def __get__(self, obj, cls):
+        if obj is None:
+            return self
+
         return super(RoutingKwargs, self).__get__(obj, cls)[1]
 
     def __set__(self, obj, value):
@@ -15,9 +15,146 @@ except ImportError:
     from Cookie import Morsel
 '''
 
-from marrow.util.compat import unicode
+from time import time, gmtime
+from datetime import date, datetime, timedelta
+from functools import wraps
+from email.utils import parsedate_tz, mktime_tz
+
+from marrow.util.compat import binary, unicode
 from marrow.util.object import NoDefault
 
+try:
+    from datetime import timezone
+    UTC = timezone.utc
+
+except ImportError:  # pragma: no cover
+    from datetime import tzinfo
+    
+    class UTC(tzinfo):
+        def utcoffset(self, dt):
+            return timedelta(0)
+        
+        def tzname(self, dt):
+            return 'UTC'
+        
+        def dst(self, dt):
+            return timedelta(0)
+    
+    UTC = UTC()
+
+
+CACHE_KEY = 'marrow.wsgi.objects.cache'  # Per-request parsed values, keyed by descriptor.
+
+DATE_CACHE_LIMIT = 1024  # Distinct HTTP-date strings remembered by the parsing cache before it is emptied.
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+_dates = dict()  # HTTP-date string to parsed datetime (or None, if invalid).
+_clock = [None, None]  # The second and formatted HTTP-date of the most recently requested current time.
+
+
+
+def cached(descriptor, obj, cls, fn):
+    """Return the value fn(descriptor, obj, cls) parsed from the descriptor's raw value, reusing an earlier result.
+    
+    Values are stored in the environment under CACHE_KEY, keyed by descriptor and tagged with the raw value they were
+    parsed from; a changed raw value is a cache miss, so direct manipulation of the environment can never return a
+    stale result.
+    """
+    
+    try:
+        cache = obj[CACHE_KEY]
+    except KeyError:
+        cache = obj[CACHE_KEY] = {}
+    
+    try:
+        raw = obj[descriptor.header]
+    except KeyError:
+        raw = NoDefault
+    
+    try:
+        seen, value = cache[descriptor]
+    except KeyError:
+        pass
+    else:
+        if seen is raw or seen == raw:
+            return value
+    
+    value = fn(descriptor, obj, cls)
+    cache[descriptor] = (raw, value)
+    return value
+
+
+def memoize(fn):
+    """Memoize the parsed value returned by a descriptor's __get__ method using cached().
+    
+    Only objects that opt in by setting a truthy `_memoize` attribute are cached.
+    """
+    
+    @wraps(fn)
+    def inner(self, obj, cls, *args, **kw):
+        if obj is None or args or kw or not getattr(obj, '_memoize', False):
+            return fn(self, obj, cls, *args, **kw)
+        
+        return cached(self, obj, cls, fn)
+    
+    return inner
+
+
+def parsedate(value):
+    """Parse an HTTP-date header value into a timezone-aware UTC datetime, or None if it can not be parsed.
+    
+    Results are cached by the string given, as clients and caches tend to send back the same few dates repeatedly.
+    """
+    
+    try:
+        return _dates[value]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+    
+    try:
+        parsed = parsedate_tz(value.decode('ascii') if isinstance(value, binary) else value)
+        result = None if parsed is None else EPOCH + timedelta(seconds=mktime_tz(parsed))
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        result = None
+    
+    if len(_dates) >= DATE_CACHE_LIMIT:
+        _dates.clear()
+    
+    _dates[value] = result
+    return result
+
+
+def formatdate(value=None):
+    """Format a datetime, date, or POSIX timestamp as an RFC 1123 HTTP-date string; the current time if omitted.
+    
+    Naive datetimes are taken to be UTC.  The current time is only formatted again once the second has changed.
+    """
+    
+    if value is None:
+        second = int(time())
+        
+        if _clock[0] != second:
+            _clock[:] = [second, formatdate(second)]
+        
+        return _clock[1]
+    
+    if isinstance(value, datetime):
+        value = value.utctimetuple()
+    
+    elif isinstance(value, date):
+        value = value.timetuple()
+    
+    else:
+        value = gmtime(value)
+    
+    return '%s, %02d %s %04d %02d:%02d:%02d GMT' % (
+            WEEKDAYS[value.tm_wday], value.tm_mday, MONTHS[value.tm_mon - 1], value.tm_year,
+            value.tm_hour, value.tm_min, value.tm_sec
+        )
 
 
 class ReaderWriter(object):
@@ -60,8 +197,14 @@ class ReaderWriter(object):
         if not self.rw or getattr(obj, 'final', False):
             raise AttributeError('%s is a read-only value.' % (self.header, ))
         
+        self.invalidate(obj)
+        
         if value is None:
-            del obj[self.header]
+            try:
+                del obj[self.header]
+            except KeyError:
+                pass
+            
             return
         
         obj[self.header] = value
@@ -70,10 +213,26 @@ class ReaderWriter(object):
         if not self.rw or getattr(obj, 'final', False):
             raise AttributeError('%s is a read-only value.' % (self.header, ))
         
+        self.invalidate(obj)
         del obj[self.header]
+    
+    def invalidate(self, obj):
+        """Discard memoized values of every descriptor backed by the same key as this one."""
+        
+        if not getattr(obj, '_memoize', False):
+            return
+        
+        try:
+            cache = obj[CACHE_KEY]
+        except KeyError:
+            return
+        
+        for descriptor in [i for i in cache if i.header == self.header]:
+            del cache[descriptor]
 
 
 class Int(ReaderWriter):
+    @memoize
     def __get__(self, obj, cls):
         if obj is None:
             return self
@@ -82,11 +241,95 @@ class Int(ReaderWriter):
             return int(super(Int, self).__get__(obj, cls))
         except AttributeError:
             return None
+        except (TypeError, ValueError):
+            return None
+    
+    def __set__(self, obj, value):
+        super(Int, self).__set__(obj, None if value is None else unicode(value).encode('ascii'))
+
+
+class ETag(ReaderWriter):
+    """An entity tag; bare values are quoted on assignment, making them strong tags."""
+    
+    def __set__(self, obj, value):
+        if value is not None:
+            value = value.decode('ascii') if isinstance(value, binary) else unicode(value)
+            
+            if not value.endswith('"'):
+                value = '"' + value + '"'
+        
+        super(ETag, self).__set__(obj, value)
+
+
+class Date(ReaderWriter):
+    """An HTTP-date, read as a timezone-aware UTC datetime.
+    
+    Datetimes, dates, and POSIX timestamps may be assigned, as may a timedelta relative to the current time.  Strings
+    are stored as given.
+    """
+    
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        
+        try:
+            value = super(Date, self).__get__(obj, cls)
+        except AttributeError:
+            return None
+        
+        return parsedate(value)
+    
+    def __set__(self, obj, value):
+        if isinstance(value, timedelta):
+            value = time() + value.days * 86400 + value.seconds + value.microseconds / 1000000.0
+        
+        if value is not None and not isinstance(value, (unicode, binary)):
+            value = formatdate(value)
+        
+        super(Date, self).__set__(obj, value)
+
+
+class TimeDelta(ReaderWriter):
+    """A delay in seconds, read as a timedelta; an HTTP-date value is read as the time remaining until then.
+    
+    Timedeltas and numbers of seconds are stored as a delay, datetimes as an HTTP-date.
+    """
+    
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        
+        try:
+            value = super(TimeDelta, self).__get__(obj, cls)
+        except AttributeError:
+            return None
+        
+        if value is None:
+            return None
+        
+        try:
+            return timedelta(seconds=int(value))
         except ValueError:
+            pass
+        
+        value = parsedate(value)
+        
+        if value is None:
             return None
+        
+        return value - datetime.now(UTC)
     
     def __set__(self, obj, value):
-        super(Int, self).__set__(obj, unicode(value).encode('ascii'))
+        if isinstance(value, timedelta):
+            value = value.days * 86400 + value.seconds
+        
+        if isinstance(value, (date, datetime)):
+            value = formatdate(value)
+        
+        elif value is not None and not isinstance(value, (unicode, binary)):
+            value = unicode(int(value))
+        
+        super(TimeDelta, self).__set__(obj, value)
 
 
 '''
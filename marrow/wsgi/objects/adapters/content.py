@@ -2,11 +2,12 @@
 
 import re
 
-from marrow.util.compat import bytestring
-from marrow.wsgi.objects.adapters.base import ReaderWriter
+from marrow.util.compat import binary, unicode, bytestring, unicodestr
+from marrow.wsgi.objects.adapters.base import ReaderWriter, memoize
 
 
 CHARSET_RE = re.compile(br';\s*charset=([^;]*)', re.I)
+BYTERANGE_RE = re.compile(r'^\s*([0-9]*)\s*-\s*([0-9]*)\s*$')  # ASCII digits only; str.isdigit() accepts others.
 
 
 class ContentType(ReaderWriter):
@@ -17,6 +18,7 @@ class ContentType(ReaderWriter):
     
     default = b''
     
+    @memoize
     def __get__(self, obj, cls, strip=True):
         value = super(ContentType, self).__get__(obj, cls)
         if not value: return None
@@ -52,6 +54,7 @@ class ContentEncoding(ReaderWriter):
     
     default = b'; charset="utf8"'
     
+    @memoize
     def __get__(self, obj, cls):
         content_type = super(ContentEncoding, self).__get__(obj, cls)
         if not content_type: return None
@@ -88,3 +91,101 @@ class ContentEncoding(ReaderWriter):
         content_type = CHARSET_RE.sub(b'', super(ContentEncoding, self).__get__(obj, None) or b'')
         new_content_type = content_type.rstrip().rstrip(b';').rstrip(b',')
         super(ContentEncoding, self).__set__(obj, new_content_type)
+
+
+
+def byterange(value):
+    """Format a slice as a single range of a byte range request header value; the reverse of byteranges.
+    
+    Empty ranges, other than the open-ended ones, and those with negative ends can not be expressed and are rejected.
+    """
+    
+    start, stop = value.start or 0, value.stop
+    
+    if value.step not in (None, 1):
+        raise ValueError("Byte ranges can not have a step: {0!r}".format(value))
+    
+    if start < 0 and stop is None:
+        return '-%d' % -start
+    
+    if start >= 0 and stop is None:
+        return '%d-' % start
+    
+    if start < 0 or stop <= start:
+        raise ValueError("Unable to express an empty or negative byte range: {0!r}".format(value))
+    
+    return '%d-%d' % (start, stop - 1)
+
+
+def byteranges(value):
+    """Parse a byte range request header value into a list of slices, or None if malformed or not for bytes.
+    
+    "bytes=0-499" is slice(0, 500), "bytes=500-" is slice(500, None), and the suffix "bytes=-500" is slice(-500, None).
+    A zero-length suffix, which can never be satisfied, is slice(0, 0).
+    """
+    
+    if not value:
+        return None
+    
+    unit, _, value = unicodestr(value, 'ascii').partition('=')
+    
+    if unit.strip().lower() != 'bytes':
+        return None
+    
+    result = []
+    
+    for spec in value.split(','):
+        spec = spec.strip()
+        
+        if not spec:
+            continue
+        
+        match = BYTERANGE_RE.match(spec)
+        
+        if not match or not (match.group(1) or match.group(2)):
+            return None
+        
+        start, stop = match.groups()
+        
+        if not start:
+            stop = int(stop)
+            result.append(slice(-stop, None) if stop else slice(0, 0))
+            continue
+        
+        start = int(start)
+        
+        if not stop:
+            result.append(slice(start, None))
+            continue
+        
+        stop = int(stop)
+        
+        if stop < start:
+            return None
+        
+        result.append(slice(start, stop + 1))
+    
+    return result or None
+
+
+class Range(ReaderWriter):
+    """Access a byte range request as a list of slices, or None if absent or malformed.
+    
+    See byteranges for the interpretation of each range.  Lists of slices, or pre-formatted strings, may be assigned;
+    slices which can not be expressed, such as empty ones, raise ValueError.
+    """
+    
+    default = None
+    
+    @memoize
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        
+        return byteranges(super(Range, self).__get__(obj, cls))
+    
+    def __set__(self, obj, value):
+        if value is not None and not isinstance(value, (binary, unicode)):
+            value = 'bytes=' + ','.join(byterange(i) for i in value)
+        
+        super(Range, self).__set__(obj, value)
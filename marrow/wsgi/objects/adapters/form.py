@@ -0,0 +1,59 @@
+# encoding: utf-8
+
+"""Adapters exposing decoded form submissions."""
+
+from marrow.util.bunch import MultiBunch
+
+from marrow.wsgi.objects.form import parse_form
+from marrow.wsgi.objects.adapters.base import ReaderWriter
+
+
+__all__ = ['Form', 'Files']
+
+
+
+def _form_files_default(self, obj):
+    """Decode the request body once, storing the (form, files) tuple in the environment for later access."""
+    
+    result = obj[self.header] = parse_form(obj)
+    return result
+
+
+class Form(ReaderWriter):
+    """Return the plain fields submitted in the request body.
+    
+    The body is only read (in blocks, spooling uploads to disk) the first time either this or the files attribute is
+    accessed.
+    """
+    
+    default = _form_files_default
+    
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        
+        return super(Form, self).__get__(obj, cls)[0]
+    
+    def __set__(self, obj, value):
+        super(Form, self).__set__(obj, (value, obj.files))
+    
+    def __delete__(self, obj):
+        super(Form, self).__set__(obj, (MultiBunch(), obj.files))
+
+
+class Files(ReaderWriter):
+    """Return the file uploads submitted in the request body as Upload instances."""
+    
+    default = _form_files_default
+    
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        
+        return super(Files, self).__get__(obj, cls)[1]
+    
+    def __set__(self, obj, value):
+        super(Files, self).__set__(obj, (obj.form, value))
+    
+    def __delete__(self, obj):
+        super(Files, self).__set__(obj, (obj.form, MultiBunch()))
@@ -4,23 +4,52 @@
 
 from __future__ import unicode_literals, division, print_function, absolute_import
 
+from marrow.wsgi.objects.headers import normalize
+
+
 
 class RequestHeaderProxy(object):
-    __slots__ = ('source', )
+    __slots__ = ('source', 'store', 'key', '_index')
     
-    def __init__(self, source):
+    def __init__(self, source, store=None, key=None):
         self.source = source
+        self.store = store  # Mapping in which the index of header names is kept for later proxies, if any.
+        self.key = key  # Key of the index within the above.
+        self._index = None  # Environ name to natural name, and sorted list of (natural, environ) name pairs.
     
     @staticmethod
     def _norm_to_env(name):
-        return 'HTTP_' + name.replace(' ', '_').replace('-', '_').upper()
+        return normalize(name)[2]
     
     @staticmethod
     def _norm_to_natural(name):
-        if name.startswith('HTTP_'):
-            name = name[5:]
+        return normalize(name[5:] if name.startswith('HTTP_') else name)[3]
+    
+    @property
+    def names(self):
+        """The (natural, environ) name pairs of every header present, ordered by environ name.
+        
+        Built once and reused until the set of HTTP_ keys in the source differs from the set indexed, however the
+        source was changed.
+        """
+        
+        index = self._index
+        
+        if index is None and self.store is not None:
+            index = self.store.get(self.key, None)
+        
+        present = [name for name in self.source if name.startswith('HTTP_')]
         
-        return name.replace('_', ' ').replace('-', ' ').title().replace(' ', '-')
+        if index is None or len(present) != len(index[0]) or not all(name in index[0] for name in present):
+            natural = self._norm_to_natural
+            pairs = [(natural(name), name) for name in sorted(present)]
+            index = (dict((name, title) for title, name in pairs), pairs)
+            
+            if self.store is not None:
+                self.store[self.key] = index
+        
+        self._index = index
+        return index[1]
     
     def get(self, name, default=None):
         name = self._norm_to_env(name)
@@ -44,9 +73,8 @@ class RequestHeaderProxy(object):
         del self.source[self._norm_to_env(name)]
     
     def __iter__(self):
-        for name in sorted(self.source):
-            if name.startswith('HTTP_'):
-                yield self._norm_to_natural(name)
+        for natural, name in self.names:
+            yield natural
     
     def __contains__(self, name):
         return self._norm_to_env(name) in self.source
@@ -54,14 +82,27 @@ class RequestHeaderProxy(object):
 
 
 class RequestHeaders(object):
+    """Access the request headers through a dictionary-like proxy.
+    
+    When the object has a WSGI environment the index of header names is stored there and reused by every proxy for the
+    remainder of the request.  The proxy itself is not stored, as it refers back to the environment.
+    """
+    
+    key = 'marrow.wsgi.objects.headers'
+    
     def __get__(self, obj, cls):
         if obj is None:
             return self
         
-        return RequestHeaderProxy(obj)
+        environ = getattr(obj, 'environ', None)
+        
+        if environ is None:
+            return RequestHeaderProxy(obj)
+        
+        return RequestHeaderProxy(environ, environ, self.key)
     
     def __set__(self, obj, value):
-        proxy = RequestHeaderProxy(obj)
+        proxy = self.__get__(obj, None)
         proxy.clear()
         
         if not value:
@@ -71,5 +112,5 @@ class RequestHeaders(object):
             proxy[name] = value
     
     def __delete__(self, obj):
-        proxy = RequestHeaderProxy(obj)
+        proxy = self.__get__(obj, None)
         proxy.clear()
@@ -6,7 +6,7 @@ import sys
 
 from marrow.util.compat import bytes, unicode
 
-__all__ = ['_reasons', '_codes', 'Status']
+__all__ = ['_reasons', '_codes', '_statuses', 'Status']
 
 
 # Blatently stolen from WebOb.
@@ -77,7 +77,12 @@ _codes = dict([(k, j) for j, k in _reasons.items()])
 
 
 class StatusValue(object):
-    __slots__ = ('numeric', 'text')
+    """An immutable HTTP status, holding its status line pre-rendered as both unicode and bytes.
+    
+    Instances for every standard code are shared; see _statuses.
+    """
+    
+    __slots__ = ('numeric', 'text', 'string', 'binary')
     
     def __init__(self, numeric, text):
         super(StatusValue, self).__init__()
@@ -85,16 +90,19 @@ class StatusValue(object):
         if isinstance(text, bytes):
             text = text.decode('ascii')
         
-        self.numeric = numeric
-        self.text = text
+        string = '%d %s' % (numeric, text)
+        
+        setattr_ = super(StatusValue, self).__setattr__
+        setattr_('numeric', numeric)
+        setattr_('text', text)
+        setattr_('string', string)
+        setattr_('binary', string.encode('ascii'))
     
-    @property
-    def binary(self):
-        return self.string.encode('ascii')
+    def __setattr__(self, name, value):
+        raise AttributeError('Status values are immutable.')
     
-    @property
-    def string(self):
-        return '%d %s' % (self.numeric, self.text)
+    def __delattr__(self, name):
+        raise AttributeError('Status values are immutable.')
     
     def __repr__(self):
         return "Status({0}, '{1}')".format(self.numeric, self.text)
@@ -117,6 +125,9 @@ class StatusValue(object):
             return self.string
 
 
+_statuses = dict([(k, StatusValue(k, j)) for k, j in _reasons.items()])
+
+
 class Status(object):
     def __init__(self, value=None):
         self.default = value
@@ -135,8 +146,17 @@ class Status(object):
         return obj._status
     
     def __set__(self, obj, value):
+        try:
+            obj._status = _statuses[value]  # Fast path for standard numeric codes.
+            return
+        except (KeyError, TypeError):
+            pass
+        
         if isinstance(value, int):
-            obj._status = StatusValue(value, _reasons[value])
+            raise ValueError("Invalid HTTP status numer: " + unicode(value))
+        
+        if isinstance(value, StatusValue):
+            obj._status = value
             return
         
         if not value:
@@ -152,19 +172,20 @@ class Status(object):
         
         if value.isdigit():
             value = int(value)
-            if value not in _reasons:
+            if value not in _statuses:
                 raise ValueError("Invalid HTTP status numer: " + unicode(value))
-            obj._status = StatusValue(value, _reasons[value])
+            obj._status = _statuses[value]
             return
         
         numeric, _, text = value.partition(' ')
         
         if numeric.isdigit():
             numeric = int(numeric)
-            obj._status = StatusValue(numeric, text)
+            standard = _statuses.get(numeric, None)
+            obj._status = standard if standard is not None and standard.text == text else StatusValue(numeric, text)
             return
         
         if value not in _codes:
             raise ValueError("Invalid HTTP status name:" + value)
         
-        obj._status = StatusValue(_codes[value], value)
+        obj._status = _statuses[_codes[value]]
@@ -0,0 +1,111 @@
+# encoding: utf-8
+
+"""Streaming gzip and deflate content coding of response bodies."""
+
+from __future__ import unicode_literals
+
+import zlib
+
+from marrow.util.compat import unicodestr
+
+
+__all__ = ['CODINGS', 'negotiate', 'compressible', 'compress', 'compressor']
+
+
+CODINGS = ('gzip', 'deflate')  # Supported content codings, in order of preference.
+
+WBITS = dict(gzip=16 + zlib.MAX_WBITS, deflate=zlib.MAX_WBITS)
+
+COMPRESSIBLE = (
+        'text/',
+        'application/json',
+        'application/javascript',
+        'application/x-javascript',
+        'application/xml',
+        'application/xhtml+xml',
+        'application/rss+xml',
+        'application/atom+xml',
+        'image/svg+xml',
+    )
+
+
+
+def negotiate(accept):
+    """Select the preferred supported content coding allowed by an Accept-Encoding header value, or None."""
+    
+    if not accept:
+        return None
+    
+    qualities = dict()
+    
+    for item in unicodestr(accept, 'ascii').lower().split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip()
+        quality = 1.0
+        
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        qualities['gzip' if coding == 'x-gzip' else coding] = quality
+    
+    wildcard = qualities.get('*', 0.0)
+    best = max(CODINGS, key=lambda coding: qualities.get(coding, wildcard))
+    
+    return best if qualities.get(best, wildcard) > 0 else None
+
+
+def compressible(mime):
+    """Determine if a response of the given media type is worth compressing.
+    
+    Only textual types are; images, archives and the like are typically compressed already.
+    """
+    
+    if not mime:
+        return False
+    
+    mime = unicodestr(mime, 'ascii').partition(';')[0].strip().lower()
+    
+    return mime.startswith(COMPRESSIBLE) or mime.endswith(('+json', '+xml'))
+
+
+def compressor(coding, level=6):
+    """Return a new zlib compression object producing the given content coding."""
+    
+    return zlib.compressobj(level, zlib.DEFLATED, WBITS[coding])
+
+
+def compress(body, coding, level=6, marker=None):
+    """Incrementally compress an iterable of binary chunks, yielding compressed chunks as they become available.
+    
+    Encountering the given marker object in the body flushes the compressor, yielding everything compressed so far in
+    a form the client can decode without waiting for more.
+    """
+    
+    engine = compressor(coding, level)
+    
+    try:
+        for chunk in body:
+            if marker is not None and chunk is marker:
+                chunk = engine.flush(zlib.Z_SYNC_FLUSH)
+                
+                if chunk:
+                    yield chunk
+                
+                continue
+            
+            chunk = engine.compress(chunk)
+            
+            if chunk:
+                yield chunk
+        
+        yield engine.flush()
+    
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
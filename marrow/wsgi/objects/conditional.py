@@ -0,0 +1,56 @@
+# encoding: utf-8
+
+"""Entity tag generation and evaluation of conditional request headers."""
+
+from __future__ import unicode_literals
+
+import re
+import hashlib
+
+from marrow.util.compat import unicodestr
+
+
+__all__ = ['strong', 'weak', 'matches']
+
+
+ETAG_RE = re.compile(r'(?:W/)?"[^"]*"')
+
+
+
+def strong(chunks):
+    """Generate a strong entity tag from the digest of an iterable of binary chunks."""
+    
+    digest = hashlib.sha1()
+    
+    for chunk in chunks:
+        digest.update(chunk)
+    
+    return '"' + digest.hexdigest() + '"'
+
+
+def weak(info):
+    """Generate a weak entity tag from the modification time and size of an os.stat result."""
+    
+    return 'W/"{0:x}-{1:x}"'.format(int(info.st_mtime), info.st_size)
+
+
+def matches(header, etag):
+    """Determine if an If-None-Match header value matches the given entity tag using the weak comparison function."""
+    
+    if not header or not etag:
+        return False
+    
+    header = unicodestr(header, 'ascii').strip()
+    
+    if header == '*':
+        return True
+    
+    etag = unicodestr(etag, 'ascii')
+    etag = etag[2:] if etag.startswith('W/') else etag
+    
+    for tag in ETAG_RE.findall(header):
+        if (tag[2:] if tag.startswith('W/') else tag) == etag:
+            return True
+    
+    return False
+
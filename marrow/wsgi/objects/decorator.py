@@ -1,19 +1,154 @@
 # encoding: utf-8
 
+from marrow.util.compat import binary, unicode
+
 from marrow.wsgi.objects.request import Request, LocalRequest
 from marrow.wsgi.objects.response import Response
-from marrow.wsgi import exceptions as exc
-
-from marrow.util.compat import exception
+from marrow.wsgi.objects.lazy import LazyModule
+from marrow.wsgi.objects.adapters.status import _statuses
 
 
 __all__ = ['wsgify']
 
 
+exc = LazyModule('marrow.wsgi.exceptions')  # Resolved the first time a decorated function raises.
+
+HANDLER_CACHE_LIMIT = 256  # Types classified by handler() remembered before the cache is emptied.
+
+_classified = dict()  # Type of return value not in HANDLERS to the function delivering it.
+
+
+
+def deliver(status, headers, body, start_response):
+    """Pass a status line, header list, and iterable body to the server using WSGI 1 or WSGI 2 as appropriate."""
+    
+    if hasattr(start_response, '__call__'):
+        start_response(status, headers)
+        return body
+    
+    return status, headers, body
+
+
+def direct(request):
+    """Determine if a string may be delivered without constructing a Response.
+    
+    This is only the case if the handler has not touched request.response and no Response feature which inspects the
+    request is enabled.
+    """
+    
+    return '_response' not in request.__dict__ and not (
+            Response.conditional or Response.ranged or Response.compress or Response.dated)
+
+
+def _none(request, result, environ, start_response):
+    return request.response(environ, start_response)
+
+
+def _binary(request, result, environ, start_response):
+    if not isinstance(result, binary):  # Servers require bytes; a bytearray or memoryview would iterate as integers.
+        result = result.tobytes() if hasattr(result, 'tobytes') else bytes(result)
+    
+    if not direct(request):
+        return _body(request, result, environ, start_response)
+    
+    defaults = Response.defaults
+    
+    headers = [
+            (b'Content-Type', '{0}; charset={1}'.format(defaults.mime, defaults.encoding).encode('ascii')),
+            (b'Content-Length', str(len(result)).encode('ascii'))
+        ]
+    
+    return deliver(_statuses[defaults.status].binary, headers, [result], start_response)
+
+
+def _unicode(request, result, environ, start_response):
+    if not direct(request):
+        return _body(request, result, environ, start_response)
+    
+    return _binary(request, result.encode(Response.defaults.encoding), environ, start_response)
+
+
+def _tuple(request, result, environ, start_response):
+    if len(result) == 3 and isinstance(result[1], list):  # A WSGI 2 (status, headers, body) triple.
+        status, headers, body = result
+        return deliver(status, headers, body, start_response)
+    
+    return _body(request, result, environ, start_response)
+
+
+def _body(request, result, environ, start_response):
+    request.response.body = result
+    return request.response(environ, start_response)
+
+
+def _application(request, result, environ, start_response):
+    return result(environ, start_response)
+
+
+HANDLERS = {  # Type of value returned by a decorated function to the function delivering it.
+        type(None): _none,
+        binary: _binary,
+        bytearray: _binary,
+        unicode: _unicode,
+        tuple: _tuple,
+        list: _body,
+        Response: _application,
+    }
+
+try:
+    HANDLERS[memoryview] = _binary
+except NameError:  # Python 2.6 lacks memoryview.
+    pass
+
+
+def handler(value):
+    """Return the function delivering the given value, classifying and remembering types not in the table.
+    
+    Subclasses are handled as their nearest tabulated base class.  Other callables, such as HTTP exceptions, are WSGI
+    applications; file-like objects and other iterables become the body of request.response.
+    """
+    
+    kind = type(value)
+    
+    try:
+        return HANDLERS[kind]
+    except KeyError:
+        pass
+    
+    try:
+        return _classified[kind]
+    except KeyError:
+        pass
+    
+    for base in getattr(kind, '__mro__', ())[1:]:
+        if base in HANDLERS:
+            found = HANDLERS[base]
+            break
+    
+    else:
+        if hasattr(value, '__call__'):
+            found = _application
+        
+        elif hasattr(value, 'read') or hasattr(value, '__iter__'):
+            found = _body
+        
+        else:
+            raise TypeError("Unable to deliver a value of type {0} as a response.".format(kind.__name__))
+    
+    if len(_classified) >= HANDLER_CACHE_LIMIT:
+        _classified.clear()
+    
+    _classified[kind] = found
+    return found
 
 
 class wsgify(object):
-    """Decorate callable to act as a WSGI1/WSGI2 application."""
+    """Decorate callable to act as a WSGI1/WSGI2 application.
+    
+    The decorated callable is passed a Request and may return None (to deliver request.response), a byte or unicode
+    string, a file-like object or other iterable body, a WSGI 2 (status, headers, body) triple, or a Response or other
+    WSGI application such as an HTTP exception, which may also be raised.
+    """
     
     def __init__(self, func=None, *args, **kw):
         self.func = func
@@ -31,26 +166,16 @@ class wsgify(object):
     
     def __call__(self, environ, start_response=None):
         req = Request(environ)
-        req.response = Response(req)
         
         try:
             resp = self.call(req, *self.args, **self.kw)
         
-        except exc.HTTPException:
-            resp = exception().exception
-        
-        if resp is None:
-            return req.response(environ, start_response)
-        
-        # Handle None
-        # Handle byte string
-        # Handle unicode string
-        # Handle file handle
-        # Handle iterable
-        # Handle exception
-        # Handle response
+        except exc.HTTPException as e:
+            # Keep only the exception itself; its traceback and context would keep every frame of the handler alive.
+            e.__traceback__ = e.__context__ = e.__cause__ = None
+            resp = e
         
-        return resp(environ, start_response)
+        return handler(resp)(req, resp, environ, start_response)
     
     def get(self, url, **kw):
         kw.setdefault('method', 'GET')
@@ -0,0 +1,326 @@
+# encoding: utf-8
+
+"""Streaming decoders for HTML form submissions contained in the request body."""
+
+from __future__ import unicode_literals
+
+import re
+
+from collections import namedtuple
+from tempfile import SpooledTemporaryFile
+
+try:
+    from urllib.parse import unquote_to_bytes
+except ImportError:  # pragma: no cover
+    from urllib import unquote as unquote_to_bytes
+
+from marrow.util.bunch import MultiBunch
+from marrow.util.compat import bytestring, unicodestr
+
+from marrow.wsgi.objects.lazy import LazyModule
+
+
+__all__ = ['Upload', 'Field', 'chunks', 'parameters', 'UrlencodedParser', 'MultipartParser', 'parse_form']
+
+
+exc = LazyModule('marrow.wsgi.exceptions')  # Only needed to reject a malformed or oversized body.
+
+BLOCK_SIZE = 64 * 1024  # Amount of wsgi.input to read at once.
+HEADER_LIMIT = 16 * 1024  # Maximum size of the headers of a single multipart part.
+FIELD_LIMIT = 1024 * 1024  # Default maximum size of the content of a single plain multipart field.
+
+PARAM_RE = re.compile(br';\s*([^\s;=]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+ESCAPE_RE = re.compile(br'\\(.)')
+
+PREAMBLE, DELIMITED, HEADERS, BODY = range(4)  # Multipart parser states.
+
+
+Upload = namedtuple('Upload', ['name', 'filename', 'mime', 'headers', 'file'])
+
+
+
+def parameters(value):
+    """Parse the semicolon-separated parameters of a binary header value.
+    
+    Returns a dictionary mapping lower-cased parameter names to unquoted values, both binary.
+    """
+    
+    result = dict()
+    
+    for name, value in PARAM_RE.findall(value):
+        value = value.strip()
+        
+        if value[:1] == b'"':
+            value = ESCAPE_RE.sub(br'\1', value[1:-1])
+        
+        result[name.lower()] = value
+    
+    return result
+
+
+def chunks(request, size=BLOCK_SIZE):
+    """Iterate the request body in blocks of at most `size` bytes.
+    
+    Never reads past CONTENT_LENGTH.  A missing or invalid length is taken to mean there is no body, as reading to the
+    end of the input may block forever, unless the server marks the input as terminated with wsgi.input_terminated.
+    Bodies declaring or delivering more than the request's _body_limit raise HTTPRequestEntityTooLarge before any
+    excess data is buffered.
+    """
+    
+    limit = getattr(request, '_body_limit', None)
+    remaining = request.length
+    
+    if remaining is None and not request.get('wsgi.input_terminated', False):
+        remaining = 0
+    
+    if limit is not None and remaining is not None and remaining > limit:
+        raise exc.HTTPRequestEntityTooLarge()
+    
+    read = request['wsgi.input'].read
+    total = 0
+    
+    while remaining is None or remaining > 0:
+        block = read(size if remaining is None else min(size, remaining))
+        
+        if not block:
+            break
+        
+        total += len(block)
+        
+        if remaining is not None:
+            remaining -= len(block)
+        
+        if limit is not None and total > limit:
+            raise exc.HTTPRequestEntityTooLarge()
+        
+        yield block
+
+
+class UrlencodedParser(object):
+    """Incrementally decode an application/x-www-form-urlencoded body.
+    
+    Pairs are split as blocks arrive, carrying any incomplete trailing pair over to the next block, and are unquoted and
+    decoded one at a time directly into the result; the body as a whole is never assembled.  Blocks without a separator
+    are appended to the incomplete pair in place, so a long value costs time linear in its length.
+    """
+    
+    def __init__(self, encoding='utf-8', fields=None):
+        self.encoding = encoding
+        self.fields = fields
+    
+    def __call__(self, blocks):
+        """Consume an iterable of binary blocks, returning a MultiBunch of the decoded fields."""
+        
+        form = MultiBunch()
+        buffer = bytearray()
+        count = 0
+        
+        for block in blocks:
+            end = block.rfind(b'&')
+            
+            if end < 0:
+                buffer += block
+                continue
+            
+            buffer += block[:end]
+            count = self._store(form, bytes(buffer).split(b'&'), count)
+            buffer = bytearray(block[end + 1:])
+        
+        self._store(form, (bytes(buffer), ), count)
+        return form
+    
+    def _store(self, form, pairs, count):
+        encoding = self.encoding
+        
+        for pair in pairs:
+            if not pair:
+                continue
+            
+            count += 1
+            
+            if self.fields is not None and count > self.fields:
+                raise exc.HTTPRequestEntityTooLarge(detail="Too many form fields.")
+            
+            name, _, value = pair.replace(b'+', b' ').partition(b'=')
+            form[unquote_to_bytes(name).decode(encoding, 'replace')] = unquote_to_bytes(value).decode(encoding, 'replace')
+        
+        return count
+
+
+class Field(object):
+    """Collect the content of a plain multipart field in memory, rejecting the request if it grows beyond a limit."""
+    
+    __slots__ = ('chunks', 'size', 'limit')
+    
+    def __init__(self, limit=None):
+        self.chunks = []
+        self.size = 0
+        self.limit = limit
+    
+    def write(self, data):
+        self.size += len(data)
+        
+        if self.limit is not None and self.size > self.limit:
+            raise exc.HTTPRequestEntityTooLarge(detail="Form field too large.")
+        
+        self.chunks.append(data)
+    
+    def getvalue(self):
+        return b''.join(self.chunks)
+
+
+class MultipartParser(object):
+    """Incrementally decode a multipart/form-data body as described by RFC 2388.
+    
+    Plain fields are collected in memory, up to `size` bytes each, and decoded to unicode.  File parts are written to
+    spooled temporary files which roll over to disk once they exceed `spool` bytes, so only one block of input plus a
+    boundary-sized tail is held in memory regardless of the size of the upload.
+    """
+    
+    def __init__(self, boundary, encoding='utf-8', spool=128 * 1024, fields=None, size=FIELD_LIMIT):
+        self.delimiter = b'\r\n--' + boundary
+        self.encoding = encoding
+        self.spool = spool
+        self.fields = fields
+        self.size = size
+    
+    def __call__(self, blocks):
+        """Consume an iterable of binary blocks, returning a (form, files) tuple of MultiBunch instances."""
+        
+        form, files = MultiBunch(), MultiBunch()
+        delimiter = self.delimiter
+        keep = len(delimiter) - 1
+        
+        buffer = b'\r\n'  # Allow the first delimiter to match without a preceding line break.
+        state = PREAMBLE
+        part = write = None
+        count = 0
+        
+        for block in blocks:
+            buffer += block
+            
+            while True:
+                if state == PREAMBLE:
+                    i = buffer.find(delimiter)
+                    
+                    if i < 0:
+                        buffer = buffer[-keep:]
+                        break
+                    
+                    buffer = buffer[i + len(delimiter):]
+                    state = DELIMITED
+                
+                if state == DELIMITED:
+                    if len(buffer) < 2:
+                        break
+                    
+                    if buffer[:2] == b'--':
+                        return form, files
+                    
+                    i = buffer.find(b'\r\n')
+                    
+                    if i < 0:
+                        break
+                    
+                    if buffer[:i].strip():
+                        raise exc.HTTPBadRequest(detail="Malformed multipart boundary.")
+                    
+                    buffer = buffer[i + 2:]
+                    state = HEADERS
+                
+                if state == HEADERS:
+                    i = buffer.find(b'\r\n\r\n')
+                    
+                    if i < 0:
+                        if len(buffer) > HEADER_LIMIT:
+                            raise exc.HTTPBadRequest(detail="Multipart headers too large.")
+                        break
+                    
+                    count += 1
+                    
+                    if self.fields is not None and count > self.fields:
+                        raise exc.HTTPRequestEntityTooLarge(detail="Too many form fields.")
+                    
+                    part = self._part(buffer[:i])
+                    write = part[-1].write
+                    buffer = buffer[i + 4:]
+                    state = BODY
+                
+                i = buffer.find(delimiter)
+                
+                if i < 0:
+                    if len(buffer) > keep:
+                        write(buffer[:-keep])
+                        buffer = buffer[-keep:]
+                    break
+                
+                write(buffer[:i])
+                self._store(form, files, part)
+                buffer = buffer[i + len(delimiter):]
+                state = DELIMITED
+        
+        raise exc.HTTPBadRequest(detail="Incomplete multipart body.")
+    
+    def _part(self, raw):
+        """Interpret the headers of a part and prepare somewhere to write its content.
+        
+        Returns a (name, filename, mime, headers, target) tuple.  Plain fields have no filename and collect their
+        content in a size-limited Field; file parts are given a spooled temporary file.
+        """
+        
+        headers = dict()
+        
+        for line in raw.split(b'\r\n'):
+            name, _, value = line.partition(b':')
+            headers[name.strip().lower().decode('ascii', 'replace')] = value.strip()
+        
+        disposition = headers.get('content-disposition', b'')
+        params = parameters(disposition)
+        name = unicodestr(params.get(b'name', b''), self.encoding)
+        filename = params.get(b'filename', None)
+        mime = headers.get('content-type', None)
+        
+        if filename is None:
+            return name, None, mime, headers, Field(self.size)
+        
+        return name, unicodestr(filename, self.encoding), mime, headers, SpooledTemporaryFile(max_size=self.spool)
+    
+    def _store(self, form, files, part):
+        name, filename, mime, headers, target = part
+        
+        if filename is None:
+            encoding = parameters(mime).get(b'charset', None) if mime else None
+            encoding = encoding.decode('ascii') if encoding else self.encoding
+            form[name] = unicodestr(target.getvalue(), encoding)
+            return
+        
+        target.seek(0)
+        files[name] = Upload(name, filename, mime.split(b';', 1)[0].strip() if mime else None, headers, target)
+
+
+def parse_form(request, size=BLOCK_SIZE):
+    """Decode the request body into a (form, files) tuple of MultiBunch instances based on its content type.
+    
+    A POST or PUT body without a content type is decoded as urlencoded only if it declares a length.
+    """
+    
+    content_type = bytestring(request.get('CONTENT_TYPE', b'') or b'', 'ascii')
+    mime = content_type.split(b';', 1)[0].strip().lower()
+    encoding = request.charset or 'utf-8'
+    fields = getattr(request, '_body_field_limit', None)
+    
+    if mime == b'application/x-www-form-urlencoded' or (not mime and request.method in ('POST', 'PUT') and request.length):
+        parser = UrlencodedParser(encoding, fields)
+        return parser(chunks(request, size)), MultiBunch()
+    
+    if mime == b'multipart/form-data':
+        boundary = parameters(content_type).get(b'boundary', None)
+        
+        if not boundary:
+            raise exc.HTTPBadRequest(detail="Multipart body without boundary.")
+        
+        parser = MultipartParser(boundary, encoding, getattr(request, '_body_spool_limit', 128 * 1024), fields,
+                getattr(request, '_body_field_size_limit', FIELD_LIMIT))
+        return parser(chunks(request, size))
+    
+    return MultiBunch(), MultiBunch()
@@ -0,0 +1,173 @@
+# encoding: utf-8
+
+"""An ordered, case-insensitive, multi-valued store of response headers held as bytes."""
+
+from __future__ import unicode_literals
+
+from marrow.util.compat import binary, unicode
+
+
+__all__ = ['Headers']
+
+
+NAME_CACHE_LIMIT = 1024  # Distinct header names remembered by the normalization cache before it is emptied.
+
+_names = dict()  # Header name as given to its (bytes, lowercase bytes, environ, natural) forms.
+
+
+
+def normalize(name):
+    """Return the bytes, lowercase bytes, WSGI environment key, and natural (Title-Case) forms of a header name.
+    
+    Words may be separated by hyphens, underscores, or spaces; for example "user_agent" has the environment key
+    "HTTP_USER_AGENT" and the natural form "User-Agent".
+    """
+    
+    try:
+        return _names[name]
+    except KeyError:
+        pass
+    
+    if len(_names) >= NAME_CACHE_LIMIT:
+        _names.clear()
+    
+    raw = name if isinstance(name, binary) else name.encode('ascii')
+    words = raw.decode('ascii').replace('_', ' ').replace('-', ' ')
+    
+    result = _names[name] = (raw, raw.lower(), 'HTTP_' + words.upper().replace(' ', '_'), words.title().replace(' ', '-'))
+    return result
+
+
+class Headers(object):
+    """An ordered list of (name, value) byte string pairs with a case-insensitive index of the positions of each name.
+    
+    Item access behaves like a dictionary, reading the first value of a header and replacing all values on assignment.
+    Additional values, such as repeated Set-Cookie headers, may be appended using add() and read using getall().  Text is
+    encoded on assignment, so the list of pairs is always ready for delivery as-is.
+    """
+    
+    __slots__ = ('pairs', '_index')
+    
+    encoding = 'utf-8'  # Used to encode text values.
+    
+    def __init__(self, pairs=None):
+        self.pairs = []
+        self._index = dict()  # Lowercase name to list of offsets into pairs.
+        
+        if pairs:
+            self.update(pairs)
+    
+    def _encode(self, value):
+        if isinstance(value, binary):
+            return value
+        
+        if not isinstance(value, unicode):
+            value = unicode(value)
+        
+        return value.encode(self.encoding)
+    
+    def _reindex(self):
+        index = self._index = dict()
+        
+        for i, (name, value) in enumerate(self.pairs):
+            index.setdefault(name.lower(), []).append(i)
+    
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.pairs)
+    
+    def __len__(self):
+        return len(self.pairs)
+    
+    def __iter__(self):
+        """Iterate the distinct header names, as first given, in order."""
+        
+        index = self._index
+        
+        for i, (name, value) in enumerate(self.pairs):
+            if index[name.lower()][0] == i:
+                yield name
+    
+    def __contains__(self, name):
+        return normalize(name)[1] in self._index
+    
+    def __getitem__(self, name):
+        return self.pairs[self._index[normalize(name)[1]][0]][1]
+    
+    def __setitem__(self, name, value):
+        raw, key = normalize(name)[:2]
+        value = self._encode(value)
+        offsets = self._index.get(key, None)
+        
+        if not offsets:
+            self._index[key] = [len(self.pairs)]
+            self.pairs.append((raw, value))
+            return
+        
+        self.pairs[offsets[0]] = (raw, value)
+        
+        if len(offsets) > 1:
+            for i in reversed(offsets[1:]):
+                del self.pairs[i]
+            
+            self._reindex()
+    
+    def __delitem__(self, name):
+        offsets = self._index[normalize(name)[1]]
+        
+        for i in reversed(offsets):
+            del self.pairs[i]
+        
+        self._reindex()
+    
+    def get(self, name, default=None):
+        offsets = self._index.get(normalize(name)[1], None)
+        return self.pairs[offsets[0]][1] if offsets else default
+    
+    def getall(self, name):
+        """Return a list of every value of the named header, in order."""
+        
+        pairs = self.pairs
+        return [pairs[i][1] for i in self._index.get(normalize(name)[1], ())]
+    
+    def add(self, name, value):
+        """Append a value for the named header, retaining any existing values."""
+        
+        raw, key = normalize(name)[:2]
+        self._index.setdefault(key, []).append(len(self.pairs))
+        self.pairs.append((raw, self._encode(value)))
+    
+    def pop(self, name, default=None):
+        value = self.get(name, default)
+        
+        if name in self:
+            del self[name]
+        
+        return value
+    
+    def update(self, other):
+        """Assign the headers from a mapping or sequence of (name, value) pairs, replacing existing values."""
+        
+        if hasattr(other, 'items'):
+            other = other.items()
+        
+        for name, value in other:
+            self[name] = value
+    
+    def items(self):
+        return list(self.pairs)
+    
+    def keys(self):
+        return list(self)
+    
+    def values(self):
+        return [value for name, value in self.pairs]
+    
+    def clear(self):
+        del self.pairs[:]
+        self._index.clear()
+    
+    def copy(self):
+        result = self.__class__()
+        result.pairs = list(self.pairs)
+        result._reindex()
+        return result
@@ -0,0 +1,25 @@
+# encoding: utf-8
+
+"""A module reference which defers importing the module until one of its attributes is used."""
+
+
+__all__ = ['LazyModule']
+
+
+
+class LazyModule(object):
+    """Stand in for a module, importing it the first time one of its attributes is read.
+    
+    Each attribute is copied onto the instance as it is read, so later reads cost an ordinary attribute lookup.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+    
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self._name)
+    
+    def __getattr__(self, name):
+        value = getattr(__import__(self._name, fromlist=(name, )), name)
+        setattr(self, name, value)
+        return value
@@ -2,22 +2,26 @@
 
 from __future__ import unicode_literals
 
+import re
 import sys
 import collections
 
 from marrow.util.compat import basestring, binary, unicode, unicodestr
 
 try:
-    from urlparse import urlparse
     from urllib import quote_plus, unquote_plus
 
 except ImportError:
-    from urllib.parse import urlparse, quote_plus, unquote_plus
+    from urllib.parse import quote_plus, unquote_plus
 
 
 __all__ = ['Path']
 
 
+UNSAFE_RE = re.compile(r'[^A-Za-z0-9_.~-]')  # Characters quote_plus would alter.
+QUOTED_RE = re.compile(r'[%+]')  # Characters unquote_plus would alter.
+
+
 
 class Path(object):
     """An object representing the path component of a URL/URI.
@@ -46,11 +50,18 @@ class Path(object):
     The full text of the RFC can be found here:
 
         http://pretty-rfc.herokuapp.com/RFC3986
+
+    Components are held as a window (start and stop offsets) onto a tuple which is never altered in-place.  Slices,
+    copies, and the results of consume() or pop() from either end are new windows onto the same tuple, making them O(1);
+    any other change assigns a fresh tuple to the Path being changed and leaves everything sharing the old one alone.
     """
 
+    __slots__ = ('_source', '_start', '_stop', '_string', 'separator', 'encoded', 'encoding')
 
     def __init__(self, value=None, separator='/', encoded=False, encoding='utf8'):
-        self.components = []
+        self._source = ()
+        self._start = self._stop = 0
+        self._string = None  # The rendered (encoded, separator, text) of the current components.
         self.separator = unicode(separator)
         self.encoded = encoded
         self.encoding = encoding
@@ -58,21 +69,55 @@ class Path(object):
         if value is not None:
             self.replace(value)
 
+    def _view(self, start, stop):
+        """Return a new Path sharing storage with this one, spanning the given absolute offsets into the source."""
+
+        view = self.__class__.__new__(self.__class__)
+        view._source, view._start, view._stop, view._string = self._source, start, stop, None
+        view.separator, view.encoded, view.encoding = self.separator, self.encoded, self.encoding
+        return view
+
+    @property
+    def components(self):
+        """A tuple of the path segments; an empty first segment is represented by the separator itself."""
+
+        if self._start == 0 and self._stop == len(self._source):
+            return self._source
+
+        return self._source[self._start:self._stop]
+
+    @components.setter
+    def components(self, value):
+        self._source = tuple(value)
+        self._start, self._stop = 0, len(self._source)
+        self._string = None
+
     def __set__(self, obj, value):
         self.replace(value)
     
     def __unicode__(self):
-        if self[:1] == [self.separator]:
-            return self.separator + self.separator.join((quote_plus(i) if self.encoded else i) for i in self[1:])
+        cached = self._string
+        
+        if cached is not None and cached[0] == self.encoded and cached[1] == self.separator:
+            return cached[2]
+        
+        separator = self.separator
+        components = self.components
+        rooted = components[:1] == (separator, )
+        
+        if rooted:
+            components = components[1:]
         
-        return self.separator.join((quote_plus(i) if self.encoded else i) for i in self)
+        if self.encoded:
+            components = [(quote_plus(i) if UNSAFE_RE.search(i) else i) for i in components]
+        
+        text = (separator if rooted else '') + separator.join(components)
+        self._string = (self.encoded, separator, text)
+        
+        return text
 
     def __bytes__(self):
-        if self[:1] == [self.separator]:
-            sep = self.separator.encode('ascii')
-            return sep + sep.join((quote_plus(i.encode(self.encoding)) if self.encoded else i) for i in self[1:])
-        
-        return self.separator.encode('ascii').join((quote_plus(i.encode(self.encoding)) if self.encoded else i.encode(self.encoding)) for i in self)
+        return self.__unicode__().encode(self.encoding)
 
     if sys.version_info[0] == 2:
         __str__ = __bytes__
@@ -89,10 +134,29 @@ class Path(object):
         if isinstance(other, basestring):
             return unicode(self) == unicode(other)
 
-        return self.components == list(other)
+        if isinstance(other, Path):
+            return len(self) == len(other) and self.components == other.components
+
+        return self.components == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
 
     def __getitem__(self, i):
-        return Path(self.components[i])
+        if isinstance(i, slice):
+            if i.step not in (None, 1):
+                return self._view(0, 0).extend(self.components[i])
+
+            start, stop, _ = i.indices(len(self))
+            return self._view(self._start + start, self._start + max(start, stop))
+
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError("Path index out of range.")
+
+        return self._view(self._start + i, self._start + i + 1)
 
     def __abs__(self):
         if self[:1] == [self.separator]:
@@ -101,13 +165,17 @@ class Path(object):
         return Path(self.separator, self.separator, self.encoded, self.encoding) + self
 
     def __len__(self):
-        return len(self.components)
+        return self._stop - self._start
 
     def __setitem__(self, key, value):
-        self.components[key] = value
+        components = list(self.components)
+        components[key] = value
+        self.components = components
 
     def __delitem__(self, key):
-        del self.components[key]
+        components = list(self.components)
+        del components[key]
+        self.components = components
     
     def __iter__(self):
         return iter(self.components)
@@ -125,49 +193,76 @@ class Path(object):
         return self
 
     def clear(self):
-        self.components = []
+        self.components = ()
         return self
 
     def extend(self, value):
-        if not isinstance(value, basestring):
-            self.components.extend(value)
+        if not isinstance(value, (basestring, binary)):
+            value = value.components if isinstance(value, Path) else tuple(value)
+            self.components = (self.components + value) if len(self) else value
             return self
         
-        encoded = self.encoded
-        encoding = self.encoding
         separator = self.separator
         
-        value = value.strip()
+        value = unicodestr(value, self.encoding).strip()
         
         rooted = value and value[0] == self.separator
         if rooted:
             if not self.components:
-                self.components.append(self.separator)
+                self.components = (self.separator, )
             value = value[1:]
         
         if not value:
             return self
         
-        self.components.extend((unquote_plus(i) if encoded else i) for i in unicodestr(value, encoding).split(separator))
+        segments = value.split(separator)
+        
+        # Only segments containing quoted characters need to be unquoted; most contain none.
+        if self.encoded and QUOTED_RE.search(value):
+            segments = [(unquote_plus(i) if QUOTED_RE.search(i) else i) for i in segments]
+        
+        self.components += tuple(segments)
         return self
     
     def append(self, value):
-        self.components.append(value)
+        self.components += (value, )
         return self
     
     def insert(self, i, x):
-        self.components.insert(i, x)
+        components = list(self.components)
+        components.insert(i, x)
+        self.components = components
         return self
     
     def remove(self, x):
-        self.components.remove(x)
+        components = list(self.components)
+        components.remove(x)
+        self.components = components
         return self
     
     def copy(self):
-        return self.__class__(unicode(self), self.separator, self.encoded, self.encoding)
+        view = self._view(self._start, self._stop)
+        view._string = self._string
+        return view
     
     def pop(self, i=-1):
-        return self.components.pop(i)
+        if i in (-1, len(self) - 1) and len(self):
+            self._stop -= 1
+            self._string = None
+            return self._source[self._stop]
+        
+        if i == 0:
+            return self.consume()
+        
+        components = list(self.components)
+        value = components.pop(i)
+        self.components = components
+        return value
     
     def consume(self):
-        return self.components.pop(0)
+        if not len(self):
+            raise IndexError("Consume from empty path.")
+        
+        self._start += 1
+        self._string = None
+        return self._source[self._start - 1]
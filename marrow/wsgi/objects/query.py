@@ -0,0 +1,143 @@
+# encoding: utf-8
+
+"""A lazily decoded, read-only view of a URL query string."""
+
+from __future__ import unicode_literals
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+
+try:
+    from urllib.parse import unquote_to_bytes
+except ImportError:  # pragma: no cover
+    from urllib import unquote as unquote_to_bytes
+
+from marrow.util.compat import binary, bytestring
+
+
+__all__ = ['Query']
+
+
+
+class Query(Mapping):
+    """A multi-valued mapping over an encoded query string.
+    
+    A single scan of the source records the offsets of each value, grouped by key; only keys are unquoted at that time.
+    Values are unquoted and decoded the first time their key is accessed and cached thereafter, so pairs nobody reads
+    cost nothing beyond the scan.
+    
+    Like MultiBunch, a key which appears once maps to a single value while repeated keys map to a list of values, get()
+    only ever returns the first value, and values may also be read as attributes.
+    """
+    
+    __slots__ = ('source', 'encoding', '_index', '_values')
+    
+    def __init__(self, source, encoding='utf-8'):
+        self.source = source or ''
+        self.encoding = encoding
+        self._index = None
+        self._values = dict()
+    
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.source)
+    
+    @property
+    def index(self):
+        """The mapping of decoded keys to lists of (start, end) offsets of their values within the source."""
+        
+        if self._index is not None:
+            return self._index
+        
+        source = self.source
+        amp, equals = (b'&', b'=') if isinstance(source, binary) else ('&', '=')
+        index = self._index = dict()
+        length = len(source)
+        start = 0
+        
+        while start < length:
+            end = source.find(amp, start)
+            
+            if end < 0:
+                end = length
+            
+            if end > start:
+                separator = source.find(equals, start, end)
+                
+                if separator < 0:
+                    key, offsets = source[start:end], (end, end)
+                else:
+                    key, offsets = source[start:separator], (separator + 1, end)
+                
+                key = self._decode(key)
+                
+                if key in index:
+                    index[key].append(offsets)
+                else:
+                    index[key] = [offsets]
+            
+            start = end + 1
+        
+        return index
+    
+    def _decode(self, value):
+        if isinstance(value, binary):
+            if b'%' in value or b'+' in value:
+                value = unquote_to_bytes(value.replace(b'+', b' '))
+            
+            return value.decode(self.encoding, 'replace')
+        
+        if '%' not in value and '+' not in value:
+            return value
+        
+        # Native strings from the server are latin-1 decoded bytes; pass anything else through as UTF-8.
+        return unquote_to_bytes(bytestring(value.replace('+', ' '), 'iso-8859-1', 'utf-8')).decode(self.encoding, 'replace')
+    
+    def getall(self, name):
+        """Return a list of every value given for the named key, which is empty if the key is absent."""
+        
+        try:
+            offsets = self.index[name]
+        except KeyError:
+            return []
+        
+        try:
+            values = self._values[name]
+        except KeyError:
+            source = self.source
+            values = self._values[name] = [self._decode(source[start:end]) for start, end in offsets]
+        
+        return list(values)
+    
+    def get(self, name, default=None):
+        if name not in self.index:
+            return default
+        
+        return self.getall(name)[0]
+    
+    def __getitem__(self, name):
+        values = self.getall(name)
+        
+        if not values:
+            raise KeyError(name)
+        
+        return values[0] if len(values) == 1 else values
+    
+    def __getattr__(self, name):
+        if name[0] == '_':
+            raise AttributeError(name)
+        
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+    
+    def __contains__(self, name):
+        return name in self.index
+    
+    def __iter__(self):
+        return iter(self.index)
+    
+    def __len__(self):
+        return len(self.index)
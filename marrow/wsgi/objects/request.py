@@ -13,10 +13,12 @@ except ImportError:
 
 from marrow.util.compat import binary, IO
 
-from .adapters.base import ReaderWriter, Int, Host
-from .adapters.args import Path
-from .adapters.content import ContentType, ContentEncoding
+from .adapters.base import ReaderWriter, Int, Date, Host
+from .adapters.args import Path, Query, RoutingArgs, RoutingKwargs
+from .adapters.content import ContentType, ContentEncoding, Range
 from .adapters.request import RequestHeaders
+from .adapters.form import Form, Files
+from .response import Response
 
 
 SCHEME_RE = re.compile(r'^[a-z]+:', re.I)
@@ -55,8 +57,11 @@ class Request(BareRequest):
     _decode_param_names = False
     _body_limit = 10 * 1024 * 1024  # 10 MiB before rejecting the request.
     _body_spool_limit = 128 * 1024  # 128 KiB before spooling to disk.
+    _body_field_limit = 1000  # Form fields before rejecting the request.
+    _body_field_size_limit = 1024 * 1024  # 1 MiB in a single plain multipart form field before rejecting the request.
     
     _writeable = True  # Can you alter the attributes of this object?
+    _memoize = False  # Cache parsed attribute values (port, mime, path, ...) in the environment?
     _final = False
     
     # General Attributes
@@ -65,8 +70,9 @@ class Request(BareRequest):
     
     # Data Attributes
     query = ReaderWriter('QUERY_STRING', default='')
-    #form = ReaderWriter()
-    #files = ReaderWriter()
+    params = Query('QUERY_STRING', default='')
+    form = Form('marrow.wsgi.objects.form')
+    files = Files('marrow.wsgi.objects.form')
     parameters = ReaderWriter('PARAMETERS', default='')
     fragment = ReaderWriter('FRAGMENT')
     #body = RequestBody('wsgi.input')
@@ -84,12 +90,12 @@ class Request(BareRequest):
     remainder = Path('PATH_INFO', default='')
     
     # WSGI Extensions
-    #args = RoutingArgs('wsgiorg.routing_args')
-    #kwargs = RoutingKwargs('wsgiorg.routing_args')
+    args = RoutingArgs('wsgiorg.routing_args')
+    kwargs = RoutingKwargs('wsgiorg.routing_args')
     
     # General Headers: Informational
     connection = ReaderWriter('HTTP_CONNECTION')
-    date = ReaderWriter('HTTP_DATE')
+    date = Date('HTTP_DATE')
     version = ReaderWriter('HTTP_MIME_VERSION')
     trailers = ReaderWriter('HTTP_TRAILERS')
     transfer = ReaderWriter('HTTP_TRANSFER_ENCODING')
@@ -107,7 +113,7 @@ class Request(BareRequest):
     # Request Headers: Conditional
     expect = ReaderWriter('HTTP_EXPECT')
     # condition.{match,modified_since,none_match,range,unmodified_since}
-    range = ReaderWriter('HTTP_RANGE')  # TODO: Rich interpretation.  (Slice.)
+    range = Range('HTTP_RANGE', rfc='14.35')
     
     # Request Headers: Security
     authorization = ReaderWriter('HTTP_AUTHORIZATION')
@@ -173,6 +179,21 @@ class Request(BareRequest):
         """
         
         return self.get('HTTP_X_REQUESTED_WITH', b'') == b'XMLHttpRequest'
+    
+    @property
+    def response(self):
+        """The response to this request, created on first access."""
+        
+        response = self.__dict__.get('_response', None)
+        
+        if response is None:
+            response = self._response = Response(self)
+        
+        return response
+    
+    @response.setter
+    def response(self, value):
+        self._response = value
 
 
 class LocalRequest(Request):
@@ -225,7 +246,7 @@ class LocalRequest(Request):
             env['REQUEST_METHOD'] = 'POST'
             body = urlencode(POST if isinstance(POST, dict) else POST).encode('utf8')
             env['wsgi.input'] = IO(body)
-            env['CONTENT_LENGTH'] = binary(len(body))
+            env['CONTENT_LENGTH'] = str(len(body))
             env['CONTENT_TYPE'] = b'application/x-www-form-urlencoded'
 
         if environ:
@@ -1,23 +1,129 @@
 # encoding: utf-8
 
+import os
+import stat
+
+from uuid import uuid4
+
 from collections import namedtuple
 
-from marrow.util.compat import binary, unicode, IO, parse_qsl, bytestring, unicodestr
+from marrow.util.compat import binary, unicode, parse_qsl, bytestring, unicodestr
 from marrow.util.bunch import Bunch, MultiBunch
-from marrow.util.insensitive import CaseInsensitiveDict
 from marrow.util.object import NoDefault
 
-from marrow.wsgi.objects.adapters.base import ReaderWriter, Int
-from marrow.wsgi.objects.adapters.content import ContentType, ContentEncoding
+from marrow.wsgi.objects.lazy import LazyModule
+from marrow.wsgi.objects.adapters.base import ReaderWriter, Int, ETag, Date, TimeDelta, parsedate, formatdate
+from marrow.wsgi.objects.adapters.content import ContentType, ContentEncoding, byteranges
 from marrow.wsgi.objects.adapters.status import Status
+from marrow.wsgi.objects.headers import Headers
+from marrow.wsgi.objects.compression import negotiate, compressible, compress, compressor
+from marrow.wsgi.objects.conditional import strong, weak, matches
 
 
 log = __import__('logging').getLogger(__name__)
-__all__ = ['Response']
+exc = LazyModule('marrow.wsgi.exceptions')  # Only needed to answer conditional and ranged requests.
+__all__ = ['Response', 'FLUSH']
 
 
 WSGIData = namedtuple('WSGIData', ['status', 'headers', 'body'])
 
+FLUSH = object()  # Yielded by a coalesced body to deliver the output buffered so far without waiting for more.
+
+NOT_MODIFIED_HEADERS = (b'cache-control', b'content-location', b'date', b'etag', b'expires', b'last-modified', b'vary')
+
+
+
+def fileno(body):
+    """Return the operating system file descriptor of a file-like object, or None if it has none."""
+    
+    try:
+        return body.fileno()
+    
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+
+
+def iterfile(body, size):
+    """Iterate a file-like object in blocks of up to `size` bytes, closing it once exhausted."""
+    
+    try:
+        data = body.read(size)
+        
+        while data:
+            yield data
+            data = body.read(size)
+    
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+
+
+def coalesce(body, encoding, threshold, marker=False):
+    """Buffer the chunks of an iterable body, encoding any unicode, yielding once at least `threshold` bytes are held.
+    
+    The FLUSH marker yields whatever is buffered immediately.  If `marker` is true the FLUSH marker itself is then
+    passed along, so that a following compressor can flush its own buffer too.
+    """
+    
+    buffer = []
+    size = 0
+    
+    try:
+        for chunk in body:
+            if chunk is FLUSH:
+                if buffer:
+                    yield b''.join(buffer)
+                    buffer, size = [], 0
+                
+                if marker:
+                    yield FLUSH
+                
+                continue
+            
+            if isinstance(chunk, unicode):
+                chunk = chunk.encode(encoding)
+            
+            buffer.append(chunk)
+            size += len(chunk)
+            
+            if size >= threshold:
+                yield b''.join(buffer)
+                buffer, size = [], 0
+        
+        if buffer:
+            yield b''.join(buffer)
+    
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+
+
+def iterranges(body, parts, size):
+    """Iterate (prefix, start, stop) parts of a seekable file-like object, seeking to each range and reading only it."""
+    
+    try:
+        for prefix, start, stop in parts:
+            if prefix:
+                yield prefix
+            
+            if stop <= start:
+                continue
+            
+            body.seek(start)
+            remaining = stop - start
+            
+            while remaining:
+                data = body.read(min(size, remaining))
+                
+                if not data:
+                    break
+                
+                remaining -= len(data)
+                yield data
+    
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
 
 
 class Response(object):
@@ -32,7 +138,16 @@ class Response(object):
     
     status = Status()
     # body = RequestBody()
-    conditional = False
+    conditional = False  # Generate missing entity tags and answer fresh conditional GET requests with 304 Not Modified.
+    block_size = 64 * 1024  # Bytes read from file bodies at a time when the server provides no file wrapper.
+    coalesce = 0  # Buffer iterable bodies into chunks of at least this many bytes before delivery; 0 to disable.
+    ranged = False  # Answer GET requests for byte ranges of binary or seekable file bodies with 206 Partial Content.
+    range_limit = 16  # Requests for more ranges than this are answered with the whole body.
+    dated = False  # Stamp the current time as the Date header on delivery, unless one has been assigned.
+    
+    compress = False  # Apply gzip or deflate content coding to eligible bodies the client will accept it for.
+    compress_level = 6  # The zlib compression level, from 1 (fastest) to 9 (smallest).
+    compress_minimum = 512  # Bodies known to be shorter than this many bytes are delivered as-is.
     
     defaults = Bunch(status=200, mime='text/html', encoding='utf-8')
     
@@ -47,13 +162,13 @@ class Response(object):
     location = ReaderWriter('Location')
     language = ReaderWriter('Content-Language')
     
-    # date = Date('Date', rfc='14.18')
+    date = Date('Date', rfc='14.18')
     age = Int('Age', rfc='14.6')
     # cache = CacheControl('Cache-Control', rfc='14.9')
-    # expires = Date('Expires', rfc='14.21')
-    # modified = Date('Last-Modified', rfc='14.29')
-    # etag = ETag('ETag', rfc='14.19')
-    # retry = TimeDelta('Retry-After', rfc='14.37')
+    expires = Date('Expires', rfc='14.21')
+    modified = Date('Last-Modified', rfc='14.29')
+    etag = ETag('ETag', None, rfc='14.19')
+    retry = TimeDelta('Retry-After', rfc='14.37')
     
     #allow = List('Allow', rfc='14.7')
     #vary = List('Vary', rfc='14.44')
@@ -61,12 +176,12 @@ class Response(object):
     # language = List('Content-Language', rfc='14.12')
     location = ReaderWriter('Content-Location', rfc='14.14')
     hash = ReaderWriter('Content-MD5', rfc='14.16')
-    # ranges = AcceptRanges('Accept-Ranges', rfc='14.16')
-    # range = ContentRange('Content-Range', rfc='14.16')
+    ranges = ReaderWriter('Accept-Ranges', None, rfc='14.5')
+    range = ReaderWriter('Content-Range', None, rfc='14.16')
     length = Int('Content-Length', rfc='14.17')
     
     def __init__(self, request=None, **kw):
-        self.headers = CaseInsensitiveDict()
+        self.headers = Headers()
         
         self.status = self.defaults.status
         self.mime = self.defaults.mime
@@ -100,43 +215,396 @@ class Response(object):
         return self.headers[name]
     
     def __setitem__(self, name, value):
+        if self._final:
+            raise AttributeError('Final responses can not be altered.')
+        
         self.headers[name] = value
     
     def __delitem__(self, name):
+        if self._final:
+            raise AttributeError('Final responses can not be altered.')
+        
         del self.headers[name]
     
+    def __setattr__(self, name, value):
+        if self._final and name != 'final':
+            raise AttributeError('Final responses can not be altered.')
+        
+        super(Response, self).__setattr__(name, value)
+    
     _final = False
+    _frozen = None
     
     @property
     def final(self):
-        """I'm the 'x' property."""
+        """Whether this response has been frozen.
+        
+        Setting this to a true value serializes the status line, headers, and body to bytes once; from then on the
+        response can not be altered and may be shared between threads, each call returning the stored serialization.
+        Once final a response can not be thawed.
+        """
         return self._final
     
     @final.setter
     def final(self, value):
-        self._final = self._final or bool(value)
+        if self._final or not value:
+            return
+        
+        self._frozen = self._freeze()
+        self._final = True
     
     @final.deleter
     def final(self):
         return
     
+    def _freeze(self):
+        body = self.body
+        
+        if body is None:
+            body = b''
+        
+        elif isinstance(body, unicode):
+            body = body.encode(self.encoding)
+        
+        elif hasattr(body, 'read'):
+            source = body
+            
+            try:
+                body = source.read()
+            finally:
+                if hasattr(source, 'close'):
+                    source.close()
+        
+        elif not isinstance(body, binary):
+            body = b''.join(bytestring(i, self.encoding) for i in body)
+        
+        self.body = body
+        
+        if self.length is None:
+            self.length = len(body)
+        
+        status, headers, body = self._serialize(False)
+        return WSGIData(status, headers, tuple(body))
+    
     @property
     def wsgi(self):
-        headers = self.headers
-        body = self.body
+        if self._final:
+            status, headers, body = self._frozen
+            headers = list(headers)  # Servers may append to the header list.
+        
+        else:
+            status, headers, body = self._serialize()
+        
+        if self.dated and 'Date' not in self.headers:
+            headers.append((b'Date', formatdate().encode('ascii')))
+        
+        return WSGIData(status, headers, body)
+    
+    def _serialize(self, negotiate=True):
+        """Produce the status line, header list, and body iterable.
+        
+        Unless negotiation is disabled, as it is when freezing a response for reuse across requests, the body may be
+        replaced in answer to the request's conditional, range, and encoding headers.  The headers and status that result
+        are applied to a copy, leaving this response unchanged for the next call.
+        """
+        
+        response = self._copy() if negotiate else self
+        encoding = response.encoding
+        body = response.body
         
         if isinstance(body, binary): body = [body]
-        elif isinstance(body, unicode): body = [body.encode(self.encoding)]
-        elif isinstance(body, IO):
-            def generator(body):
-                data = body.read(1024)
-                while data:
-                    yield data
-                    data = body.read(1024)
+        elif isinstance(body, unicode): body = [body.encode(encoding)]
+        
+        if negotiate and response.conditional:
+            response._validator(body)
             
-            body = generator(body)
+            if response.fresh:
+                return response._not_modified()
+        
+        if negotiate and response.ranged:
+            try:
+                body = response._partial(body)
+            except exc.HTTPRequestedRangeNotSatisfiable as e:
+                return WSGIData(*e(response.environ))
+        
+        if response.length is None and int(response.status) not in (204, 304):
+            response.length = response._measure(body)
+        
+        coding = response._coding(body) if negotiate and response.compress else None
+        
+        streamed = body is not None and not isinstance(body, (list, tuple)) and not hasattr(body, 'read')
+        
+        if response.coalesce and streamed:
+            body = coalesce(body, encoding, response.coalesce, bool(coding))
+        
+        if hasattr(body, 'read'):
+            body = iterfile(body, response.block_size) if coding else response._file(body)
+        
+        if coding:
+            body = response._compress(body, coding)
+        
+        return WSGIData(response.status.binary, list(response.headers.pairs), body)
+    
+    def _copy(self):
+        """Return a shallow copy of this response with its own headers, to which per-request results may be applied."""
+        
+        response = self.__class__.__new__(self.__class__)
+        response.__dict__.update(self.__dict__)
+        response.__dict__['headers'] = self.headers.copy()
+        
+        return response
+    
+    @property
+    def fresh(self):
+        """Whether the client already holds the current representation, according to its conditional request headers.
+        
+        If-None-Match is compared against the ETag using the weak comparison function; only in its absence is
+        If-Modified-Since compared against Last-Modified.  Handlers able to assign a validator before producing the body
+        can check this first and skip producing it.
+        """
+        
+        environ = self.environ
+        
+        if not environ or environ.get('REQUEST_METHOD', 'GET') not in ('GET', 'HEAD') or int(self.status) != 200:
+            return False
+        
+        condition = environ.get('HTTP_IF_NONE_MATCH', None)
+        
+        if condition:
+            return matches(condition, self.etag)
+        
+        since = parsedate(environ.get('HTTP_IF_MODIFIED_SINCE', None))
+        modified = self.modified
+        
+        return since is not None and modified is not None and modified <= since
+    
+    def _validator(self, body):
+        """Generate an entity tag if none was supplied: strong for bodies held in memory, weak for regular files.
+        
+        Other iterables can not be tagged without buffering them, as headers are delivered before the body.
+        """
+        
+        if self.etag is not None:
+            return
+        
+        if isinstance(body, list):
+            self.etag = strong([bytestring(i, self.encoding) for i in body])
+            return
+        
+        descriptor = fileno(body)
+        
+        if descriptor is None:
+            return
+        
+        info = os.fstat(descriptor)
+        
+        if stat.S_ISREG(info.st_mode):
+            self.etag = weak(info)
+    
+    def _partial(self, body):
+        """Select the byte ranges of the body requested by the client, if any, updating the status and headers.
+        
+        Binary bodies are sliced; seekable files are measured and later read by seeking to each range in turn.  A single
+        range is delivered as-is with a Content-Range header, several as a multipart/byteranges body.  An If-Range
+        validator that does not match the strong ETag or exact Last-Modified date results in the whole body.
+        """
+        
+        environ = self.environ
+        
+        if not environ or environ.get('REQUEST_METHOD', 'GET') != 'GET' or int(self.status) != 200:
+            return body
+        
+        data = None
+        
+        if isinstance(body, list):
+            data = b''.join(bytestring(i, self.encoding) for i in body)
+            position, total = 0, len(data)
+        
+        elif hasattr(body, 'seek') and hasattr(body, 'tell') and getattr(body, 'seekable', lambda: True)():
+            position = body.tell()
+            body.seek(0, 2)
+            total = body.tell() - position
+            body.seek(position)
+        
+        else:
+            return body
+        
+        self.ranges = 'bytes'
+        
+        requested = byteranges(environ.get('HTTP_RANGE', None))
+        
+        if not requested or len(requested) > self.range_limit or not self._if_range(environ.get('HTTP_IF_RANGE', None)):
+            return body
+        
+        selected = []
+        
+        for i in requested:
+            start, stop, _ = i.indices(total)
+            
+            if start < stop:
+                selected.append((start, stop))
+        
+        if not selected:
+            if hasattr(body, 'close'):
+                body.close()
+            
+            error = exc.HTTPRequestedRangeNotSatisfiable()
+            error.headers.append((b'Content-Range', ('bytes */%d' % (total, )).encode('ascii')))
+            raise error
+        
+        self.status = 206
+        
+        if len(selected) == 1:
+            start, stop = selected[0]
+            self.range = 'bytes %d-%d/%d' % (start, stop - 1, total)
+            self.length = stop - start
+            parts = [(None, start, stop)]
+        
+        else:
+            boundary = uuid4().hex
+            mime = bytestring(self['Content-Type'], 'ascii')
+            parts = [(
+                    (b'\r\n' if i else b'') + b'--' + boundary.encode('ascii') + b'\r\nContent-Type: ' + mime +
+                    ('\r\nContent-Range: bytes %d-%d/%d\r\n\r\n' % (start, stop - 1, total)).encode('ascii'),
+                    start, stop
+                ) for i, (start, stop) in enumerate(selected)]
+            parts.append((b'\r\n--' + boundary.encode('ascii') + b'--\r\n', 0, 0))
+            
+            self['Content-Type'] = 'multipart/byteranges; boundary=' + boundary
+            self.length = sum(len(prefix) + stop - start for prefix, start, stop in parts)
+        
+        if data is not None:
+            return [j for prefix, start, stop in parts for j in (prefix, data[start:stop]) if j]
+        
+        return iterranges(body, [(prefix, position + start, position + stop) for prefix, start, stop in parts], self.block_size)
+    
+    def _if_range(self, condition):
+        """Determine if an If-Range header value, if present, still identifies the current representation."""
+        
+        if not condition:
+            return True
+        
+        condition = unicodestr(condition, 'ascii').strip()
+        
+        if condition.startswith(('"', 'W/')):
+            etag = self.etag
+            return bool(etag) and not condition.startswith('W/') and condition == unicodestr(etag, 'ascii')
+        
+        modified = self.modified
+        return modified is not None and parsedate(condition) == modified
+    
+    def _not_modified(self):
+        """Discard the body and produce a 304 Not Modified response retaining the validator and caching headers."""
+        
+        if hasattr(self.body, 'close'):
+            self.body.close()
+        
+        headers = [(n, v) for n, v in self.headers.pairs if n.lower() in NOT_MODIFIED_HEADERS]
+        
+        return WSGIData(*exc.HTTPNotModified(None, headers)(self.environ))
+    
+    def _coding(self, body):
+        """Determine the content coding, if any, to apply to the given body when delivering it to this request.
+        
+        Responses which would be compressed for a client accepting it vary on Accept-Encoding whatever this client
+        accepts, so that caches do not deliver a compressed representation to clients unable to decode it.
+        """
+        
+        if self.environ is None or body is None or int(self.status) in (204, 206, 304):
+            return None
+        
+        if self.headers.get('Content-Encoding', None):
+            return None  # Already encoded.
+        
+        if not compressible(self.mime):
+            return None
+        
+        length = self.length
+        
+        if length is not None and length < self.compress_minimum:
+            return None
+        
+        vary = self.headers.get('Vary', None)
+        
+        if not vary:
+            self['Vary'] = b'Accept-Encoding'
+        elif b'accept-encoding' not in [i.strip().lower() for i in vary.split(b',')] and vary.strip() != b'*':
+            self['Vary'] = vary + b', Accept-Encoding'
+        
+        return negotiate(self.environ.get('HTTP_ACCEPT_ENCODING', None))
+    
+    def _compress(self, body, coding):
+        """Apply the given content coding to a body, updating the headers describing it.
+        
+        Bodies already held in memory are compressed at once and their Content-Length updated; any other iterable is
+        compressed incrementally as it is consumed, dropping the now unknowable Content-Length.
+        """
+        
+        self['Content-Encoding'] = coding
+        
+        etag = unicodestr(self.etag or '', 'ascii')
+        
+        if etag and not etag.startswith('W/'):
+            self.etag = 'W/' + etag  # The compressed representation is only semantically equivalent.
+        
+        if isinstance(body, list):
+            engine = compressor(coding, self.compress_level)
+            body = b''.join([engine.compress(chunk) for chunk in body] + [engine.flush()])
+            self.length = len(body)
+            return [body]
+        
+        if self.length is not None:
+            del self.length
+        
+        return compress(body, coding, self.compress_level, FLUSH)
+    
+    def _measure(self, body):
+        """Determine the length in bytes of the remainder of a body without consuming it, or None if that is not cheap.
+        
+        Sequences of binary chunks are summed, real files measured using fstat, and in-memory binary files using their
+        buffer.  Other iterables, such as generators, are left alone.
+        """
+        
+        if isinstance(body, (list, tuple)):
+            length = 0
+            
+            for chunk in body:
+                if not isinstance(chunk, binary):
+                    return None
+                
+                length += len(chunk)
+            
+            return length
+        
+        if not hasattr(body, 'read'):
+            return None
+        
+        descriptor = fileno(body)
+        
+        if descriptor is not None:
+            info = os.fstat(descriptor)
+            return info.st_size - body.tell() if stat.S_ISREG(info.st_mode) else None
+        
+        try:
+            with body.getbuffer() as view:  # Released at once, as an exported buffer prevents resizing.
+                return view.nbytes - body.tell()
+        except (AttributeError, ValueError):
+            return None
+    
+    def _file(self, body):
+        """Prepare a file-like body for delivery, using the server's file wrapper for real files where available."""
+        
+        descriptor = fileno(body)
+        
+        if descriptor is None:
+            return iterfile(body, self.block_size)
+        
+        wrapper = (self.environ or {}).get('wsgi.file_wrapper', None)
+        
+        if wrapper is not None:
+            return wrapper(body, self.block_size)
         
-        return WSGIData(bytestring(unicode(self.status), 'ascii'), [(bytestring(n, self.encoding), bytestring(headers[n], self.encoding)) for n in headers], body)
+        return iterfile(body, self.block_size)
     
     def __call__(self, environ=None, start_response=None):
         """Process the headers and content body and return a 3-tuple of status, header list, and iterable body.
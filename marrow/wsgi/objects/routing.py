@@ -0,0 +1,200 @@
+# encoding: utf-8
+
+"""A path router which compiles route patterns into a trie of path segments.
+
+Patterns are slash-separated, each segment being one of:
+
+    literal     Matches the segment exactly.
+    {name}      Matches any single segment, captured as a keyword argument.
+    {}          Matches any single segment, captured as a positional argument.
+    *           As the final segment only: matches any remaining path, which is left in PATH_INFO.
+
+Literal segments are preferred over captures, and captures over a trailing wildcard, at every level.  Matching walks
+one level of the trie per path segment, so dispatch cost depends on the depth of the path, not the number of routes.
+"""
+
+from __future__ import unicode_literals
+
+from marrow.util.object import NoDefault
+
+from marrow.wsgi.objects.lazy import LazyModule
+from marrow.wsgi.objects.path import Path
+from marrow.wsgi.objects.request import Request
+
+
+__all__ = ['Router']
+
+
+exc = LazyModule('marrow.wsgi.exceptions')  # Only needed to answer unmatched paths.
+
+
+
+class Node(object):
+    """A single level of the routing trie."""
+    
+    __slots__ = ('children', 'capture', 'name', 'target', 'wildcard')
+    
+    def __init__(self):
+        self.children = dict()  # Literal segment to Node.
+        self.capture = None  # Node reached by capturing any segment.
+        self.name = None  # Keyword the captured segment is stored under; None for positional.
+        self.target = NoDefault  # Target of a route ending exactly here.
+        self.wildcard = NoDefault  # Target of a route ending here with a trailing wildcard.
+
+
+class Router(object):
+    """Dispatch requests to targets based on the leading segments of PATH_INFO.
+    
+    Routes may be passed in as a mapping or an iterable of (pattern, target) pairs.  Instances are WSGI applications,
+    calling the matched target as one, and may also be used to resolve a target without calling it using route().
+    """
+    
+    def __init__(self, routes=None):
+        self.root = Node()
+        
+        if hasattr(routes, 'items'):
+            routes = routes.items()
+        
+        for pattern, target in (routes or ()):
+            self.add(pattern, target)
+    
+    def add(self, pattern, target):
+        """Compile the given pattern into the trie, replacing any existing target for an identical pattern."""
+        
+        node = self.root
+        segments = self.segments(Path(pattern).components)
+        
+        for i, segment in enumerate(segments):
+            if segment == '*':
+                if i != len(segments) - 1:
+                    raise ValueError("Wildcard must be the final segment of route: " + pattern)
+                
+                node.wildcard = target
+                return self
+            
+            if segment[:1] == '{' and segment[-1:] == '}':
+                name = segment[1:-1] or None
+                
+                if node.capture is None:
+                    node.capture, node.name = Node(), name
+                
+                elif node.name != name:
+                    raise ValueError("Conflicting capture {0!r} in route: {1}".format(segment, pattern))
+                
+                node = node.capture
+                continue
+            
+            node = node.children.setdefault(segment, Node())
+        
+        node.target = target
+        return self
+    
+    @staticmethod
+    def segments(components):
+        """Strip the root marker and any single trailing empty segment from a component tuple."""
+        
+        start = 1 if components[:1] == ('/', ) else 0
+        stop = len(components) - 1 if len(components) > start and components[-1] == '' else len(components)
+        return components[start:stop]
+    
+    def match(self, segments):
+        """Match a sequence of path segments.
+        
+        Returns a (target, consumed, args, kwargs) tuple, where consumed is the number of segments matched, or None if
+        no route matches.
+        """
+        
+        args, kwargs = [], dict()
+        result = self._match(self.root, segments, 0, args, kwargs)
+        
+        if result is None:
+            return None
+        
+        return result[0], result[1], tuple(args), kwargs
+    
+    def _match(self, node, segments, i, args, kwargs):
+        if i == len(segments):
+            if node.target is not NoDefault:
+                return node.target, i
+            
+            if node.wildcard is not NoDefault:
+                return node.wildcard, i
+            
+            return None
+        
+        segment = segments[i]
+        child = node.children.get(segment)
+        
+        if child is not None:
+            result = self._match(child, segments, i + 1, args, kwargs)
+            
+            if result is not None:
+                return result
+        
+        if node.capture is not None:
+            if node.name is None:
+                args.append(segment)
+            else:
+                previous = kwargs.get(node.name, NoDefault)
+                kwargs[node.name] = segment
+            
+            result = self._match(node.capture, segments, i + 1, args, kwargs)
+            
+            if result is not None:
+                return result
+            
+            if node.name is None:
+                args.pop()
+            elif previous is NoDefault:
+                del kwargs[node.name]
+            else:
+                kwargs[node.name] = previous
+        
+        if node.wildcard is not NoDefault:
+            return node.wildcard, i
+        
+        return None
+    
+    def route(self, request):
+        """Resolve the target for the given request, or None if no route matches.
+        
+        On a match the matched segments are moved from PATH_INFO to SCRIPT_NAME and the captured values are added to
+        wsgiorg.routing_args.
+        """
+        
+        remainder = request.remainder
+        components = remainder.components
+        result = self.match(self.segments(components))
+        
+        if result is None:
+            return None
+        
+        target, consumed, args, kwargs = result
+        
+        if consumed:
+            start = 1 if components[:1] == ('/', ) else 0
+            path = request.path
+            
+            request.path = (path if len(path) else Path('/')).extend(remainder[start:start + consumed])
+            remainder = remainder[start + consumed:]
+            request.remainder = abs(remainder) if len(remainder) else ''
+        
+        existing = request.get('wsgiorg.routing_args', None)
+        
+        if existing:
+            args = tuple(existing[0]) + args
+            merged = existing[1].__class__(existing[1])
+            merged.update(kwargs)
+            kwargs = merged
+        
+        request['wsgiorg.routing_args'] = (args, kwargs)
+        
+        return target
+    
+    def __call__(self, environ, start_response=None):
+        target = self.route(Request(environ))
+        
+        if target is None:
+            return exc.HTTPNotFound()(environ, start_response)
+        
+        return target(environ, start_response)
@@ -0,0 +1,71 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.path import Path as PathObj
+from marrow.wsgi.objects.adapters.args import Path
+from helpers import MockObject
+
+
+class TestPath(TestCase):
+    class Mock(MockObject):
+        path = Path('PATH_INFO', default='')
+    
+    def setUp(self):
+        self.inst = self.Mock()
+        self.inst['PATH_INFO'] = '/foo/bar'
+    
+    def test_get(self):
+        self.assertIsInstance(self.Mock.path, Path)
+        self.assertIsInstance(self.inst.path, PathObj)
+        self.assertEquals(('/', 'foo', 'bar'), self.inst.path.components)
+    
+    def test_shared(self):
+        first, second = self.inst.path, self.inst.path
+        
+        self.assertFalse(first is second)
+        self.assertTrue(first.components is second.components)
+    
+    def test_not_memoized(self):
+        self.inst._memoize = False
+        first, second = self.inst.path, self.inst.path
+        
+        self.assertTrue(first.components is second.components)
+    
+    def test_invalidated(self):
+        first = self.inst.path
+        self.inst['PATH_INFO'] = '/baz'
+        
+        self.assertEquals('/baz', str(self.inst.path))
+        self.assertEquals('/foo/bar', str(first))
+    
+    def test_local_changes(self):
+        path = self.inst.path
+        self.assertEquals('/', path.consume())
+        
+        self.assertEquals(('foo', 'bar'), path.components)
+        self.assertEquals(('/', 'foo', 'bar'), self.inst.path.components)
+        self.assertEquals('/foo/bar', self.inst['PATH_INFO'])
+    
+    def test_environ_change(self):
+        self.inst.path
+        self.inst['PATH_INFO'] = '/baz'
+        self.assertEquals(('/', 'baz'), self.inst.path.components)
+    
+    def test_set(self):
+        path = self.inst.path
+        path.append('baz')
+        
+        self.inst.path = path
+        self.assertEquals('/foo/bar/baz', self.inst['PATH_INFO'])
+        self.assertEquals(('/', 'foo', 'bar', 'baz'), self.inst.path.components)
+    
+    def test_delete(self):
+        del self.inst.path
+        self.assertEquals('', self.inst['PATH_INFO'])
+        self.assertEquals((), self.inst.path.components)
@@ -7,7 +7,10 @@ try:  # This to handle Python 2.6 which is missing a lot.
 except ImportError:
     from unittest import TestCase
 
-from marrow.wsgi.objects.adapters.base import ReaderWriter, Int
+from datetime import date, datetime, timedelta
+
+from marrow.wsgi.objects.adapters import base
+from marrow.wsgi.objects.adapters.base import ReaderWriter, Int, Date, TimeDelta, CACHE_KEY, UTC
 from helpers import MockObject
 
 
@@ -94,3 +97,112 @@ class TestIntReaderWriter(TestCase):
     def test_int_write(self):
         self.inst.numeric = 42
         self.assertEquals(b"42", self.inst['diz'])
+
+
+class TestDateReaderWriter(TestCase):
+    class Mock(MockObject):
+        when = Date('Date')
+        delay = TimeDelta('Retry-After')
+    
+    def setUp(self):
+        self.inst = self.Mock()
+    
+    def test_date_read(self):
+        self.assertEquals(None, self.inst.when)
+        
+        self.inst['Date'] = b"Sun, 06 Nov 1994 08:49:37 GMT"
+        self.assertEquals(datetime(1994, 11, 6, 8, 49, 37, tzinfo=UTC), self.inst.when)
+        
+        self.inst['Date'] = "Sunday, 06-Nov-94 08:49:37 GMT"
+        self.assertEquals(datetime(1994, 11, 6, 8, 49, 37, tzinfo=UTC), self.inst.when)
+        
+        self.inst['Date'] = "bad"
+        self.assertEquals(None, self.inst.when)
+    
+    def test_date_write(self):
+        self.inst.when = datetime(1994, 11, 6, 8, 49, 37)
+        self.assertEquals("Sun, 06 Nov 1994 08:49:37 GMT", self.inst['Date'])
+        
+        self.inst.when = datetime(1994, 11, 6, 8, 49, 37, tzinfo=UTC)
+        self.assertEquals("Sun, 06 Nov 1994 08:49:37 GMT", self.inst['Date'])
+        
+        self.inst.when = date(1994, 11, 6)
+        self.assertEquals("Sun, 06 Nov 1994 00:00:00 GMT", self.inst['Date'])
+        
+        self.inst.when = 784111777
+        self.assertEquals("Sun, 06 Nov 1994 08:49:37 GMT", self.inst['Date'])
+        
+        self.inst.when = timedelta(hours=1)
+        self.assertTrue(timedelta(minutes=59) < self.inst.when - datetime.now(UTC) <= timedelta(hours=1))
+        
+        self.inst.when = None
+        self.assertEquals(None, self.inst.when)
+    
+    def test_parse_cache(self):
+        base._dates.clear()
+        
+        self.inst['Date'] = "Sun, 06 Nov 1994 08:49:37 GMT"
+        self.assertTrue(self.inst.when is self.inst.when)
+        self.assertEquals(1, len(base._dates))
+    
+    def test_current(self):
+        current = base.formatdate()
+        
+        self.assertTrue(current is base._clock[1])
+        self.assertEquals(base.formatdate(base._clock[0]), current)
+    
+    def test_delta(self):
+        self.assertEquals(None, self.inst.delay)
+        
+        self.inst.delay = timedelta(minutes=2)
+        self.assertEquals("120", self.inst['Retry-After'])
+        self.assertEquals(timedelta(minutes=2), self.inst.delay)
+        
+        self.inst.delay = 30
+        self.assertEquals(timedelta(seconds=30), self.inst.delay)
+        
+        self.inst.delay = datetime.now(UTC) + timedelta(hours=1)
+        self.assertTrue(self.inst['Retry-After'].endswith(' GMT'))
+        self.assertTrue(timedelta(minutes=59) < self.inst.delay <= timedelta(hours=1))
+
+
+class TestMemoization(TestCase):
+    class Mock(MockObject):
+        _memoize = True
+        numeric = Int('diz')
+        other = Int('diz')
+    
+    def setUp(self):
+        self.inst = self.Mock()
+        self.inst['diz'] = b"27"
+    
+    def test_disabled(self):
+        inst = TestIntReaderWriter.Mock()
+        inst['diz'] = b"27"
+        self.assertEquals(27, inst.numeric)
+        self.assertNotIn(CACHE_KEY, inst)
+    
+    def test_cached(self):
+        self.assertEquals(27, self.inst.numeric)
+        self.assertEquals((b"27", 27), self.inst[CACHE_KEY][self.Mock.numeric])
+        
+        self.inst[CACHE_KEY][self.Mock.numeric] = (b"27", 42)
+        self.assertEquals(42, self.inst.numeric)
+    
+    def test_raw_change(self):
+        self.assertEquals(27, self.inst.numeric)
+        
+        self.inst['diz'] = b"42"
+        self.assertEquals(42, self.inst.numeric)
+    
+    def test_invalidation(self):
+        self.assertEquals(27, self.inst.numeric)
+        self.assertEquals(27, self.inst.other)
+        
+        self.inst.numeric = 42
+        self.assertEquals(dict(), self.inst[CACHE_KEY])
+        self.assertEquals(42, self.inst.other)
+        
+        del self.inst.other
+        self.assertNotIn(self.Mock.other, self.inst[CACHE_KEY])
+        self.assertEquals(None, self.inst.numeric)
@@ -7,7 +7,7 @@ try:  # This to handle Python 2.6 which is missing a lot.
 except ImportError:
     from unittest import TestCase
 
-from marrow.wsgi.objects.adapters.content import ContentType, ContentEncoding
+from marrow.wsgi.objects.adapters.content import ContentType, ContentEncoding, Range
 from helpers import MockObject
 
 
@@ -75,3 +75,34 @@ class TestContentEncoding(TestCase):
         self.inst.encoding = "latin1"
         del self.inst.encoding
         self.assertEquals(b'', self.inst['CONTENT_TYPE'])
+
+
+class TestRange(TestCase):
+    class Mock(MockObject):
+        range = Range('HTTP_RANGE')
+    
+    def setUp(self):
+        self.inst = self.Mock()
+    
+    def test_empty(self):
+        self.assertEquals(None, self.inst.range)
+    
+    def test_parse(self):
+        self.inst['HTTP_RANGE'] = b"bytes=0-499, 500-, -250"
+        self.assertEquals([slice(0, 500), slice(500, None), slice(-250, None)], self.inst.range)
+        
+        self.inst['HTTP_RANGE'] = "bytes=-0"
+        self.assertEquals([slice(0, 0)], self.inst.range)
+    
+    def test_malformed(self):
+        for value in ("bytes=500-100", "bytes=a-b", "bytes=-", "items=0-5", "bytes=", b"bytes=\xb2-5", "bytes=1-\xb9\xb2"):
+            self.inst['HTTP_RANGE'] = value
+            self.assertEquals(None, self.inst.range)
+    
+    def test_assign(self):
+        self.inst.range = [slice(0, 500), slice(1000, None), slice(-5, None)]
+        self.assertEquals("bytes=0-499,1000-,-5", self.inst['HTTP_RANGE'])
+    
+    def test_assign_invalid(self):
+        for value in (slice(0, 0), slice(5, 5), slice(10, 5), slice(0, -1), slice(-5, -1), slice(0, 10, 2)):
+            self.assertRaises(ValueError, setattr, self.inst, 'range', [value])
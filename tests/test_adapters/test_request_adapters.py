@@ -60,6 +60,28 @@ class TestHeaderProxy(TestCase):
     
     def test_contains(self):
         self.assertIn('Content-Type', self.proxy)
+    
+    def test_index_reused(self):
+        names = self.proxy.names
+        self.assertEquals([('Content-Type', 'HTTP_CONTENT_TYPE'), ('Host', 'HTTP_HOST')], names)
+        
+        self.proxy['Host'] = 'localhost'
+        self.assertTrue(self.proxy.names is names)
+    
+    def test_index_invalidated(self):
+        names = self.proxy.names
+        
+        self.proxy['Accept'] = 'text/html'
+        self.assertEquals(['Accept', 'Content-Type', 'Host'], list(self.proxy))
+        
+        del self.proxy['Host']
+        self.assertEquals(['Accept', 'Content-Type'], list(self.proxy))
+        
+        self.source['HTTP_X_FOO'] = 'bar'
+        self.assertEquals(['Accept', 'Content-Type', 'X-Foo'], list(self.proxy))
+        
+        self.source['HTTP_X_BAR'] = self.source.pop('HTTP_X_FOO')
+        self.assertEquals(['Accept', 'Content-Type', 'X-Bar'], list(self.proxy))
 
 
 class TestRequestHeaders(TestCase):
@@ -89,3 +111,24 @@ class TestRequestHeaders(TestCase):
     def test_del(self):
         del self.inst.headers
         self.assertEquals(self.inst._data, dict())
+    
+    def test_environ_reuse(self):
+        self.inst.environ = dict(HTTP_HOST='example.com')
+        
+        proxy = self.inst.headers
+        names = proxy.names
+        
+        self.assertTrue(proxy.source is self.inst.environ)
+        self.assertTrue(self.inst.headers.names is names)
+        self.assertFalse(any(isinstance(i, RequestHeaderProxy) for i in self.inst.environ.values()))
+        
+        self.inst.environ['HTTP_ACCEPT'] = 'text/html'
+        self.assertEquals(['Accept', 'Host'], list(self.inst.headers))
+    
+    def test_same_size(self):
+        self.inst.environ = dict(HTTP_HOST='example.com')
+        self.assertEquals(['Host'], list(self.inst.headers))
+        
+        del self.inst.environ['HTTP_HOST']
+        self.inst.environ['HTTP_ACCEPT'] = 'text/html'
+        self.assertEquals(['Accept'], list(self.inst.headers))
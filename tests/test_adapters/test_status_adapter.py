@@ -35,6 +35,13 @@ class TestStatusValue(TestCase):
     def test_binary(self):
         inst = StatusValue(200, b"OK")
         self.assertEquals("OK", inst.text)
+    
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.inst.numeric = 404
+        
+        with self.assertRaises(AttributeError):
+            del self.inst.text
 
 
 class TestStatus(TestCase):
@@ -107,3 +114,26 @@ class TestStatus(TestCase):
         self.inst.status = (748, "Confounded by Ponies")
         self.assertEquals(748, int(self.inst.status))
         self.assertEquals("748 Confounded by Ponies", unicode(self.inst.status))
+    
+    def test_interned(self):
+        first, second = self.Mock(), self.Mock()
+        
+        self.assertTrue(first.status is second.status)
+        
+        first.status = 404
+        second.status = "Not Found"
+        self.assertTrue(first.status is second.status)
+        
+        second.status = "404 Not Found"
+        self.assertTrue(first.status is second.status)
+    
+    def test_custom_reason(self):
+        self.inst.status = "404 Gone Fishing"
+        
+        self.assertEquals("404 Gone Fishing", unicode(self.inst.status))
+        self.assertEquals(b"404 Gone Fishing", self.inst.status.binary)
+        self.assertFalse(self.inst.status is self.Mock().status)
+    
+    def test_invalid_numeric(self):
+        with self.assertRaises(ValueError):
+            self.inst.status = 742
@@ -0,0 +1,158 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.util.compat import IO
+
+from marrow.wsgi import exceptions as exc
+from marrow.wsgi.objects.response import Response
+from marrow.wsgi.objects.decorator import wsgify, handler, _application, _body
+
+
+def environ(**kw):
+    kw.setdefault('REQUEST_METHOD', 'GET')
+    return kw
+
+
+def returning(value):
+    @wsgify
+    def application(request):
+        return value
+    
+    return application
+
+
+class TestDispatch(TestCase):
+    def test_none(self):
+        @wsgify
+        def application(request):
+            request.response.mime = 'text/plain'
+            request.response.body = b'Hello.'
+        
+        status, headers, body = application(environ())
+        
+        self.assertEquals(b'200 OK', status)
+        self.assertEquals(b'text/plain; charset=utf-8', dict(headers)[b'Content-Type'])
+        self.assertEquals([b'Hello.'], body)
+    
+    def test_binary(self):
+        status, headers, body = returning(b'Hello.')(environ())
+        
+        self.assertEquals(b'200 OK', status)
+        self.assertEquals([(b'Content-Type', b'text/html; charset=utf-8'), (b'Content-Length', b'6')], headers)
+        self.assertEquals([b'Hello.'], body)
+    
+    def test_buffers(self):
+        for value in (bytearray(b'Hello.'), memoryview(b'Hello.')):
+            status, headers, body = returning(value)(environ())
+            
+            self.assertEquals(b'6', dict(headers)[b'Content-Length'])
+            self.assertEquals([b'Hello.'], body)
+            self.assertTrue(type(body[0]) is bytes)
+    
+    def test_unicode(self):
+        status, headers, body = returning('Héllo.')(environ())
+        
+        self.assertEquals(b'7', dict(headers)[b'Content-Length'])
+        self.assertEquals(['Héllo.'.encode('utf-8')], body)
+    
+    def test_binary_with_response(self):
+        @wsgify
+        def application(request):
+            request.response.status = 404
+            return b'Missing.'
+        
+        status, headers, body = application(environ())
+        
+        self.assertEquals(b'404 Not Found', status)
+        self.assertEquals([b'Missing.'], body)
+    
+    def test_binary_with_features(self):
+        Response.compress = True
+        
+        try:
+            status, headers, body = returning(b'Hello. ' * 1000)(environ(HTTP_ACCEPT_ENCODING='gzip'))
+        
+        finally:
+            Response.compress = False
+        
+        self.assertEquals(b'gzip', dict(headers)[b'Content-Encoding'])
+    
+    def test_start_response(self):
+        started = []
+        body = returning(b'Hello.')(environ(), lambda status, headers: started.append((status, headers)))
+        
+        self.assertEquals([b'Hello.'], body)
+        self.assertEquals(b'200 OK', started[0][0])
+    
+    def test_triple(self):
+        triple = (b'201 Created', [(b'Location', b'/1')], [b''])
+        
+        self.assertEquals(triple, returning(triple)(environ()))
+    
+    def test_iterable(self):
+        def generator():
+            yield b'Hello'
+            yield b'.'
+        
+        status, headers, body = returning(generator())(environ())
+        
+        self.assertEquals(b'Hello.', b''.join(body))
+        self.assertEquals([b'a', b'b'], returning([b'a', b'b'])(environ())[2])
+        self.assertEquals([b'a', b'b'], list(returning((b'a', b'b'))(environ())[2]))
+    
+    def test_file(self):
+        status, headers, body = returning(IO(b'Hello.'))(environ())
+        
+        self.assertEquals(b'6', dict(headers)[b'Content-Length'])
+        self.assertEquals(b'Hello.', b''.join(body))
+    
+    def test_response(self):
+        status, headers, body = returning(Response(body=b'Hello.', status=202))(environ())
+        
+        self.assertEquals(b'202 Accepted', status)
+        self.assertEquals([b'Hello.'], body)
+    
+    def test_exception(self):
+        self.assertEquals(b'404 Not Found', returning(exc.HTTPNotFound())(environ())[0])
+        
+        @wsgify
+        def application(request):
+            raise exc.HTTPForbidden()
+        
+        self.assertEquals(b'403 Forbidden', application(environ())[0])
+    
+    def test_other_exception(self):
+        @wsgify
+        def application(request):
+            raise ValueError()
+        
+        self.assertRaises(ValueError, application, environ())
+    
+    def test_undeliverable(self):
+        self.assertRaises(TypeError, returning(27), environ())
+
+
+class TestHandler(TestCase):
+    def test_classification(self):
+        class Custom(Response):
+            pass
+        
+        self.assertEquals(_application, handler(Custom()))
+        self.assertEquals(_application, handler(exc.HTTPNotFound()))
+        self.assertEquals(_body, handler(IO()))
+        self.assertEquals(_body, handler(set()))
+    
+    def test_bounded(self):
+        from marrow.wsgi.objects import decorator
+        
+        for i in range(decorator.HANDLER_CACHE_LIMIT + 10):
+            handler(type(str('Custom'), (object, ), dict(__iter__=lambda self: iter(()), ))())
+        
+        self.assertTrue(len(decorator._classified) <= decorator.HANDLER_CACHE_LIMIT)
+        self.assertFalse(set in decorator.HANDLERS)
@@ -0,0 +1,52 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi import exceptions as exc
+from marrow.wsgi.objects.decorator import wsgify
+
+
+class TestRegistry(TestCase):
+    def test_codes(self):
+        self.assertTrue(exc.codes[404] is exc.HTTPNotFound)
+        self.assertTrue(exc.codes[304] is exc.HTTPNotModified)
+        self.assertTrue(exc.codes[507] is exc.HTTPInsufficientStorage)
+        self.assertFalse(None in exc.codes)
+        
+        for code, cls in exc.codes.items():
+            self.assertEquals(code, cls.code)
+    
+    def test_abort(self):
+        with self.assertRaises(exc.HTTPNotFound) as context:
+            exc.abort(404, detail="Widget 27")
+        
+        self.assertEquals("Widget 27", context.exception.detail)
+    
+    def test_abort_redirect(self):
+        with self.assertRaises(exc.HTTPFound) as context:
+            exc.abort(302, b'/login')
+        
+        self.assertTrue((b'Location', b'/login') in context.exception.headers)
+    
+    def test_abort_unknown(self):
+        self.assertRaises(ValueError, exc.abort, 742)
+
+
+class TestWsgify(TestCase):
+    def test_released(self):
+        error = exc.HTTPNotFound()
+        
+        @wsgify
+        def application(request):
+            raise error
+        
+        status, headers, body = application(dict(REQUEST_METHOD='GET'))
+        
+        self.assertEquals(b'404 Not Found', status)
+        self.assertEquals(None, error.__traceback__)
+        self.assertEquals(None, error.__context__)
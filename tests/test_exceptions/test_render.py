@@ -0,0 +1,138 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+import json
+
+from marrow.wsgi import exceptions as exc
+
+
+class TestRender(TestCase):
+    def setUp(self):
+        exc._rendered.clear()
+    
+    def test_class_explanation(self):
+        status, headers, body = exc.HTTPNotFound()(dict())
+        
+        self.assertEquals(b'404 Not Found', status)
+        self.assertTrue(b'<p>The resource could not be found.</p>' in body[0])
+    
+    def test_custom(self):
+        status, headers, body = exc.HTTPNotFound("No such widget.", "Widget 27")(dict())
+        
+        self.assertTrue(b'<p>No such widget.</p>' in body[0])
+        self.assertTrue(b'<div>Widget 27</div>' in body[0])
+        self.assertEquals("Widget 27", str(exc.HTTPNotFound("No such widget.", "Widget 27")))
+    
+    def test_cached(self):
+        first = exc.HTTPNotFound()(dict())[2][0]
+        second = exc.HTTPNotFound()(dict(PATH_INFO='/other'))[2][0]
+        
+        self.assertTrue(first is second)
+        self.assertEquals(1, len(exc._rendered))
+    
+    def test_placeholders(self):
+        self.assertEquals((), exc.placeholders('Nothing to see here.'))
+        self.assertEquals(('REQUEST_METHOD', ), exc.placeholders('The method {REQUEST_METHOD} is not allowed.'))
+        self.assertEquals(('a', 'b'), exc.placeholders('{b.real} {a[0]} {b}'))
+    
+    def test_environ(self):
+        error = exc.HTTPMethodNotAllowed()
+        
+        post = error(dict(REQUEST_METHOD='POST', PATH_INFO='/'))[2][0]
+        put = error(dict(REQUEST_METHOD='PUT'))[2][0]
+        
+        self.assertTrue(b'The method POST is not allowed' in post)
+        self.assertTrue(b'The method PUT is not allowed' in put)
+        self.assertTrue(post is error(dict(REQUEST_METHOD='POST'))[2][0])
+    
+    def test_escaped(self):
+        script = '<script>alert(1)</script>'
+        
+        body = exc.HTTPMethodNotAllowed()(dict(REQUEST_METHOD=script))[2][0]
+        self.assertFalse(b'<script>' in body)
+        self.assertTrue(b'&lt;script&gt;alert(1)&lt;/script&gt;' in body)
+        
+        body = exc.HTTPNotFound(detail=script)(dict())[2][0]
+        self.assertFalse(b'<script>' in body)
+    
+    def test_start_response(self):
+        calls = []
+        body = exc.HTTPGone()(dict(), lambda status, headers: calls.append(status))
+        
+        self.assertEquals([b'410 Gone'], calls)
+        self.assertTrue(b'no longer available' in body[0])
+    
+    def test_unicode_status(self):
+        status, headers, body = exc.HTTPLocked()(dict())
+        
+        self.assertEquals(b'423 Locked', status)
+        self.assertTrue(b'The resource is locked' in body[0])
+
+
+class TestNegotiation(TestCase):
+    def test_negotiate(self):
+        self.assertEquals('text/html', exc.negotiate(None))
+        self.assertEquals('text/html', exc.negotiate('*/*'))
+        self.assertEquals('application/json', exc.negotiate('application/json'))
+        self.assertEquals('text/plain', exc.negotiate('text/plain'))
+        self.assertEquals('text/html', exc.negotiate('text/*'))
+        self.assertEquals('application/json', exc.negotiate('text/html;q=0.5, application/json'))
+        self.assertEquals('application/json', exc.negotiate('application/json, */*;q=0.1'))
+        self.assertEquals('text/html', exc.negotiate('image/png'))
+    
+    def test_json(self):
+        status, headers, body = exc.HTTPNotFound(detail="Widget 27")(dict(HTTP_ACCEPT='application/json'))
+        headers = dict(headers)
+        
+        self.assertEquals(b'application/json', headers[b'Content-Type'])
+        self.assertEquals(str(len(body[0])).encode('ascii'), headers[b'Content-Length'])
+        self.assertEquals(b'Accept', headers[b'Vary'])
+        self.assertEquals(
+                dict(code=404, status="Not Found", explanation="The resource could not be found.", detail="Widget 27"),
+                json.loads(body[0].decode('ascii'))
+            )
+    
+    def test_text(self):
+        status, headers, body = exc.HTTPNotFound()(dict(HTTP_ACCEPT='text/plain'))
+        
+        self.assertEquals(b'text/plain; charset=utf-8', dict(headers)[b'Content-Type'])
+        self.assertEquals(b'404 Not Found\n\nThe resource could not be found.\n\n\n', body[0])
+    
+    def test_html(self):
+        status, headers, body = exc.HTTPNotFound()(dict(HTTP_ACCEPT='text/html,application/xhtml+xml,*/*;q=0.8'))
+        headers = dict(headers)
+        
+        self.assertEquals(b'text/html; charset=iso-8859-1', headers[b'Content-Type'])
+        self.assertEquals(str(len(body[0])).encode('ascii'), headers[b'Content-Length'])
+        self.assertTrue(body[0].startswith(b'<html>'))
+    
+    def test_html_escaped(self):
+        accept = 'text/html, <script>alert(1)</script>'
+        status, headers, body = exc.HTTPNotAcceptable()(dict(HTTP_ACCEPT=accept, REQUEST_METHOD='<b>GET</b>'))
+        
+        self.assertEquals(b'406 Not Acceptable', status)
+        self.assertFalse(b'<script>' in body[0])
+        self.assertTrue(b'&lt;script&gt;alert(1)&lt;/script&gt;' in body[0])
+        
+        status, headers, body = exc.HTTPMethodNotAllowed()(dict(HTTP_ACCEPT=accept, REQUEST_METHOD='<b>GET</b>'))
+        
+        self.assertFalse(b'<b>' in body[0])
+        self.assertTrue(b'&lt;b&gt;GET&lt;/b&gt;' in body[0])
+    
+    def test_text_unescaped(self):
+        body = exc.HTTPMethodNotAllowed()(dict(HTTP_ACCEPT='text/plain', REQUEST_METHOD='<b>'))[2][0]
+        self.assertTrue(b'The method <b> is not allowed' in body)
+    
+    def test_explicit_body(self):
+        error = exc.HTTPNotFound()
+        error.body = b'<p>Gone fishing.</p>'
+        status, headers, body = error(dict(HTTP_ACCEPT='application/json'))
+        
+        self.assertEquals([b'<p>Gone fishing.</p>'], body)
+        self.assertEquals(b'text/html; charset=iso-8859-1', dict(headers)[b'Content-Type'])
@@ -0,0 +1,103 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase, skipIf, skipUnless
+except ImportError:
+    from unittest import TestCase, skipIf, skipUnless
+
+import os
+import re
+import sys
+import subprocess
+
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$', re.M)
+
+DEFERRED = ('marrow.wsgi.exceptions', 'marrow.wsgi.objects.routing')
+
+BUDGET = 50000  # Microseconds the modules of this package may spend importing themselves, ignoring their dependencies.
+
+LOOSE_BUDGET = BUDGET * 10  # Checked on every run; generous enough for slow or heavily loaded machines.
+
+
+def run(statement, *options):
+    """Execute a statement in a fresh interpreter, returning its standard output and error."""
+    
+    process = subprocess.Popen([sys.executable] + list(options) + ['-c', statement],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    
+    assert process.returncode == 0, err
+    
+    return out.decode('utf-8'), err.decode('utf-8')
+
+
+def loaded(statement):
+    """Execute a statement in a fresh interpreter, returning the names of the modules it leaves in sys.modules."""
+    
+    out, err = run(statement + "\nimport sys\nprint('\\n'.join(sys.modules))")
+    return out.split()
+
+
+def importtime(statement):
+    """Execute a statement in a fresh interpreter, returning a list of (module, self, cumulative) import timings."""
+    
+    out, err = run(statement, '-X', 'importtime')
+    return [(name, int(own), int(total)) for own, total, depth, name in IMPORTTIME_RE.findall(err)]
+
+
+@skipIf(sys.version_info < (3, 7), "Lazy module attributes require Python 3.7.")
+class TestDeferred(TestCase):
+    def assertDeferred(self, statement):
+        modules = loaded(statement)
+        
+        for name in DEFERRED:
+            self.assertNotIn(name, modules)
+    
+    def test_package(self):
+        self.assertDeferred("import marrow.wsgi.objects")
+    
+    def test_decorator(self):
+        self.assertDeferred("from marrow.wsgi.objects import wsgify")
+    
+    def test_response(self):
+        self.assertDeferred("from marrow.wsgi.objects.response import Response")
+    
+    def test_lazy(self):
+        modules = loaded("import marrow.wsgi.objects")
+        self.assertNotIn('marrow.wsgi.objects.request', modules)
+        self.assertNotIn('marrow.wsgi.objects.response', modules)
+        
+        modules = loaded("from marrow.wsgi.objects import Router")
+        self.assertIn('marrow.wsgi.objects.routing', modules)
+        self.assertNotIn('marrow.wsgi.objects.decorator', modules)
+    
+    def test_resolved(self):
+        modules = loaded("from marrow.wsgi.objects.response import exc\nexc.HTTPNotFound")
+        self.assertIn('marrow.wsgi.exceptions', modules)
+    
+    def test_on_demand(self):
+        from marrow.wsgi import objects
+        from marrow.wsgi.objects.response import Response
+        
+        self.assertTrue(objects.Response is Response)
+        self.assertIn('Response', dir(objects))
+        self.assertRaises(AttributeError, lambda: objects.Missing)
+
+
+@skipIf(sys.version_info < (3, 7), "Import timing requires Python 3.7.")
+class TestImportTime(TestCase):
+    def assertWithin(self, budget):
+        timings = importtime("from marrow.wsgi.objects import wsgify")
+        spent = sum(own for name, own, total in timings if name.startswith('marrow.wsgi.objects'))
+        
+        self.assertTrue(spent < budget, "Importing wsgify took {0}µs, over the {1}µs budget.".format(spent, budget))
+    
+    def test_loose_budget(self):
+        self.assertWithin(LOOSE_BUDGET)
+    
+    @skipUnless(os.environ.get('BENCHMARK', None), "Set BENCHMARK in the environment to run timing benchmarks.")
+    def test_budget(self):
+        self.assertWithin(BUDGET)
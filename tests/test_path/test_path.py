@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.path import Path
+
+
+class TestPathViews(TestCase):
+    def setUp(self):
+        self.path = Path('/foo/bar/baz')
+    
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            self.path.foo = 27
+    
+    def test_slice(self):
+        view = self.path[1:3]
+        
+        self.assertTrue(view._source is self.path._source)
+        self.assertEquals(('foo', 'bar'), view.components)
+        self.assertEquals(2, len(view))
+        self.assertEquals('foo/bar', str(view))
+        self.assertEquals(('/', 'baz'), self.path[::3].components)
+        self.assertEquals((), self.path[3:1].components)
+    
+    def test_index(self):
+        self.assertEquals(('bar', ), self.path[2].components)
+        self.assertEquals(('baz', ), self.path[-1].components)
+        
+        with self.assertRaises(IndexError):
+            self.path[4]
+    
+    def test_copy(self):
+        copy = self.path.copy()
+        
+        self.assertTrue(copy.components is self.path.components)
+        self.assertEquals(self.path, copy)
+    
+    def test_copy_on_write(self):
+        view = self.path[1:]
+        view.append('diz')
+        view[0] = 'FOO'
+        
+        self.assertEquals(('FOO', 'bar', 'baz', 'diz'), view.components)
+        self.assertEquals(('/', 'foo', 'bar', 'baz'), self.path.components)
+    
+    def test_consume(self):
+        copy = self.path.copy()
+        
+        self.assertEquals('/', copy.consume())
+        self.assertEquals('baz', copy.pop())
+        self.assertEquals(('foo', 'bar'), copy.components)
+        self.assertTrue(copy._source is self.path._source)
+        self.assertEquals(4, len(self.path))
+        
+        copy.consume()
+        copy.consume()
+        
+        with self.assertRaises(IndexError):
+            copy.consume()
+    
+    def test_concatenation(self):
+        self.assertEquals('/foo/bar/baz/diz', str(self.path + 'diz'))
+        self.assertEquals('/foo/bar', str(abs(Path('foo/bar'))))
+        self.assertEquals(('/', 'foo', 'bar', 'baz'), self.path.components)
+        
+        empty = Path()
+        self.assertTrue((empty + self.path).components is self.path.components)
+
+
+class TestPathEncoding(TestCase):
+    def test_decoding(self):
+        path = Path('/foo%20bar/a+b/plain', encoded=True)
+        self.assertEquals(('/', 'foo bar', 'a b', 'plain'), path.components)
+    
+    def test_binary(self):
+        self.assertEquals(('/', 'caf\xe9'), Path(b'/caf\xc3\xa9').components)
+        self.assertEquals(b'/caf\xc3\xa9', bytes(Path('/caf\xe9')))
+    
+    def test_encoding(self):
+        path = Path(['/', 'foo bar', 'a/b', 'plain'], encoded=True)
+        self.assertEquals('/foo+bar/a%2Fb/plain', str(path))
+        
+        path.encoded = False
+        self.assertEquals('/foo bar/a/b/plain', str(path))
+    
+    def test_rendering_cached(self):
+        path = Path('/foo/bar')
+        text = str(path)
+        
+        self.assertTrue(str(path) is text)
+        self.assertTrue(str(path.copy()) is text)
+    
+    def test_rendering_invalidated(self):
+        path = Path('/foo/bar')
+        str(path)
+        
+        path.append('baz')
+        self.assertEquals('/foo/bar/baz', str(path))
+        
+        path.consume()
+        self.assertEquals('foo/bar/baz', str(path))
+        
+        path.pop()
+        self.assertEquals('foo/bar', str(path))
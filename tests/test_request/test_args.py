@@ -0,0 +1,49 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.util.compat import IO
+
+from marrow.wsgi.objects.request import LocalRequest
+
+
+class TestRoutingArgs(TestCase):
+    def setUp(self):
+        self.request = LocalRequest(path='/foo/bar?baz=27', POST=dict(diz='42'))
+    
+    def test_values(self):
+        self.assertEquals(('/', 'foo', 'bar'), self.request.args)
+        self.assertEquals(dict(baz='27', diz='42'), self.request.kwargs)
+    
+    def test_computed_once(self):
+        self.assertNotIn('wsgiorg.routing_args', self.request.environ)
+        
+        kwargs = self.request.kwargs
+        self.assertTrue(self.request['wsgiorg.routing_args'][1] is kwargs)
+        self.assertTrue(self.request.kwargs is kwargs)
+        self.assertTrue(self.request['wsgiorg.routing_args'][0] is self.request.args)
+    
+    def test_existing(self):
+        self.request['wsgiorg.routing_args'] = (('a', ), dict(b='c'))
+        
+        self.assertEquals(('a', ), self.request.args)
+        self.assertEquals(dict(b='c'), self.request.kwargs)
+    
+    def test_assignment(self):
+        self.request.args = ('x', )
+        self.assertEquals((('x', ), dict(baz='27', diz='42')), self.request['wsgiorg.routing_args'])
+    
+    def test_untyped_body(self):
+        request = LocalRequest(dict(REQUEST_METHOD='POST', **{'wsgi.input': IO(b'diz=42')}), '/foo?baz=27')
+        del request['CONTENT_LENGTH']
+        
+        self.assertEquals(dict(baz='27'), request.kwargs)
+        
+        request = LocalRequest(dict(REQUEST_METHOD='POST', CONTENT_LENGTH='6', **{'wsgi.input': IO(b'diz=42')}), '/foo?baz=27')
+        
+        self.assertEquals(dict(baz='27', diz='42'), request.kwargs)
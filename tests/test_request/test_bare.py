@@ -7,7 +7,10 @@ try:  # This to handle Python 2.6 which is missing a lot.
 except ImportError:
     from unittest import TestCase
 
-from marrow.wsgi.objects.request import BareRequest
+from datetime import datetime
+
+from marrow.wsgi.objects.adapters.base import UTC
+from marrow.wsgi.objects.request import BareRequest, LocalRequest
 
 
 class TestBareRequest(TestCase):
@@ -52,3 +55,15 @@ class TestBareRequest(TestCase):
         
         self.assertEquals("<BareRequest", repr(request).partition(' ')[0])
         self.assertEquals(">", repr(request)[-1])
+
+
+class TestRequestDate(TestCase):
+    def test_parsed(self):
+        request = LocalRequest(dict(HTTP_DATE='Sun, 06 Nov 1994 08:49:37 GMT'))
+        
+        self.assertEquals(datetime(1994, 11, 6, 8, 49, 37, tzinfo=UTC), request.date)
+        self.assertEquals('Sun, 06 Nov 1994 08:49:37 GMT', request['HTTP_DATE'])
+    
+    def test_missing(self):
+        self.assertEquals(None, LocalRequest().date)
+        self.assertEquals(None, LocalRequest(dict(HTTP_DATE='yesterday')).date)
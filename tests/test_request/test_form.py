@@ -0,0 +1,164 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.util.compat import IO
+
+from marrow.wsgi.exceptions import HTTPBadRequest, HTTPRequestEntityTooLarge
+from marrow.wsgi.objects.form import UrlencodedParser, MultipartParser
+from marrow.wsgi.objects.request import LocalRequest
+
+
+BODY = b'\r\n'.join([
+        b'--xyzzy',
+        b'Content-Disposition: form-data; name="title"',
+        b'',
+        b'Hello world',
+        b'--xyzzy',
+        b'Content-Disposition: form-data; name="tag"',
+        b'',
+        b'one',
+        b'--xyzzy',
+        b'Content-Disposition: form-data; name="tag"',
+        b'',
+        b'two',
+        b'--xyzzy',
+        b'Content-Disposition: form-data; name="upload"; filename="data.bin"',
+        b'Content-Type: application/octet-stream',
+        b'',
+        b'\x00\x01--xyzz\r\n--xyz' * 1000,
+        b'--xyzzy--',
+        b''
+    ])
+
+
+class TestUrlencoded(TestCase):
+    def test_post(self):
+        request = LocalRequest(POST=[('name', 'Alice'), ('tag', 'a b'), ('tag', '\u2603&=')])
+        
+        self.assertEquals("Alice", request.form.name)
+        self.assertEquals(["a b", "\u2603&="], request.form.tag)
+        self.assertEquals(dict(), request.files)
+    
+    def test_split_blocks(self):
+        body = b'first=one&second=tw%C3%A9+o&blank=&bare&&last=x'
+        
+        for size in (1, 2, 5, len(body)):
+            form = UrlencodedParser()(body[i:i + size] for i in range(0, len(body), size))
+            self.assertEquals(dict(first="one", second="tw\xe9 o", blank="", bare="", last="x"), form)
+    
+    def test_long_value(self):
+        body = b'a=1&long=' + b'x%20' * 50000 + b'&b=2'
+        form = UrlencodedParser()(body[i:i + 16] for i in range(0, len(body), 16))
+        
+        self.assertEquals(dict(a="1", long="x " * 50000, b="2"), form)
+    
+    def test_field_limit(self):
+        request = LocalRequest(POST=[('f', str(i)) for i in range(10)], _body_field_limit=5)
+        
+        with self.assertRaises(HTTPRequestEntityTooLarge):
+            request.form
+    
+    def test_body_limit(self):
+        request = LocalRequest(POST=dict(data='x' * 2048), _body_limit=1024)
+        
+        with self.assertRaises(HTTPRequestEntityTooLarge):
+            request.form
+
+    
+    def test_missing_length(self):
+        class Unterminated(object):
+            def read(self, size=-1):
+                raise AssertionError("Input without a length should not be read.")
+        
+        for length in (None, 'invalid'):
+            request = LocalRequest({'REQUEST_METHOD': 'POST', 'CONTENT_TYPE': b'application/x-www-form-urlencoded',
+                    'CONTENT_LENGTH': length, 'wsgi.input': Unterminated()})
+            
+            if length is None:
+                del request['CONTENT_LENGTH']
+            
+            self.assertEquals(dict(), request.form)
+    
+    def test_terminated(self):
+        request = LocalRequest({'REQUEST_METHOD': 'POST', 'CONTENT_TYPE': b'application/x-www-form-urlencoded',
+                'wsgi.input': IO(b'name=Alice'), 'wsgi.input_terminated': True})
+        del request['CONTENT_LENGTH']
+        
+        self.assertEquals("Alice", request.form.name)
+
+
+class TestMultipart(TestCase):
+    def request(self, body=BODY, **kw):
+        return LocalRequest(dict(
+                REQUEST_METHOD = 'POST',
+                CONTENT_TYPE = b'multipart/form-data; boundary=xyzzy',
+                CONTENT_LENGTH = str(len(body)),
+                **{'wsgi.input': IO(body)}
+            ), **kw)
+    
+    def test_fields(self):
+        request = self.request()
+        
+        self.assertEquals("Hello world", request.form.title)
+        self.assertEquals(["one", "two"], request.form.tag)
+    
+    def test_files(self):
+        request = self.request()
+        upload = request.files.upload
+        
+        self.assertEquals("upload", upload.name)
+        self.assertEquals("data.bin", upload.filename)
+        self.assertEquals(b"application/octet-stream", upload.mime)
+        self.assertEquals(b'\x00\x01--xyzz\r\n--xyz' * 1000, upload.file.read())
+    
+    def test_small_blocks(self):
+        parser = MultipartParser(b'xyzzy')
+        form, files = parser(BODY[i:i + 7] for i in range(0, len(BODY), 7))
+        
+        self.assertEquals("Hello world", form.title)
+        self.assertEquals(b'\x00\x01--xyzz\r\n--xyz' * 1000, files.upload.file.read())
+    
+    def test_spooling(self):
+        request = self.request(_body_spool_limit=1024)
+        self.assertTrue(request.files.upload.file._rolled)
+        
+        request = self.request()
+        self.assertFalse(request.files.upload.file._rolled)
+    
+    def test_parsed_once(self):
+        request = self.request()
+        self.assertTrue(request.form is request.form)
+        self.assertTrue(request.files is request.files)
+    
+    def test_body_limit(self):
+        request = self.request(_body_limit=1024)
+        
+        with self.assertRaises(HTTPRequestEntityTooLarge):
+            request.form
+    
+    def test_field_size_limit(self):
+        request = self.request(_body_field_size_limit=5)
+        
+        with self.assertRaises(HTTPRequestEntityTooLarge):
+            request.form
+        
+        parser = MultipartParser(b'xyzzy', size=11)
+        form, files = parser(BODY[i:i + 7] for i in range(0, len(BODY), 7))
+        self.assertEquals("Hello world", form.title)
+    
+    def test_truncated(self):
+        request = self.request(BODY[:-20])
+        
+        with self.assertRaises(HTTPBadRequest):
+            request.form
+    
+    def test_other_content(self):
+        request = LocalRequest()
+        self.assertEquals(dict(), request.form)
+        self.assertEquals(dict(), request.files)
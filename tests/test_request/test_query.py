@@ -0,0 +1,76 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.query import Query
+from marrow.wsgi.objects.request import LocalRequest
+
+
+class TestQuery(TestCase):
+    def setUp(self):
+        self.inst = Query('name=Alice&tag=a+b&tag=%E2%98%83&blank=&bare&&a%20b=c')
+    
+    def test_keys(self):
+        self.assertEquals(['name', 'tag', 'blank', 'bare', 'a b'], list(self.inst))
+        self.assertEquals(5, len(self.inst))
+        self.assertIn('a b', self.inst)
+        self.assertNotIn('missing', self.inst)
+    
+    def test_lazy(self):
+        self.assertEquals(dict(), self.inst._values)
+        self.assertEquals("Alice", self.inst['name'])
+        self.assertEquals(dict(name=["Alice"]), self.inst._values)
+    
+    def test_values(self):
+        self.assertEquals("Alice", self.inst.name)
+        self.assertEquals(["a b", "☃"], self.inst['tag'])
+        self.assertEquals("", self.inst['blank'])
+        self.assertEquals("", self.inst['bare'])
+        
+        with self.assertRaises(KeyError):
+            self.inst['missing']
+        
+        with self.assertRaises(AttributeError):
+            self.inst.missing
+    
+    def test_get(self):
+        self.assertEquals("a b", self.inst.get('tag'))
+        self.assertEquals(None, self.inst.get('missing'))
+        self.assertEquals(27, self.inst.get('missing', 27))
+    
+    def test_getall(self):
+        self.assertEquals(["Alice"], self.inst.getall('name'))
+        self.assertEquals(["a b", "☃"], self.inst.getall('tag'))
+        self.assertEquals([], self.inst.getall('missing'))
+    
+    def test_binary(self):
+        inst = Query(b'name=%C3%A9&x=y')
+        self.assertEquals(dict(name="\xe9", x="y"), dict(inst))
+
+
+class TestRequestQuery(TestCase):
+    def test_reuse(self):
+        request = LocalRequest(path='/?foo=bar')
+        
+        self.assertEquals("bar", request.params.foo)
+        self.assertTrue(request.params is request.params)
+        
+        request.query = 'foo=baz'
+        self.assertEquals("baz", request.params.foo)
+    
+    def test_assignment(self):
+        request = LocalRequest(path='/?foo=bar')
+        
+        request.params = [('a', '1'), ('a', '2')]
+        self.assertEquals('a=1&a=2', request.query)
+        
+        request.params = dict(b=['3', '4'])
+        self.assertEquals('b=3&b=4', request.query)
+        
+        del request.params
+        self.assertEquals(0, len(request.params))
@@ -0,0 +1,62 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+import zlib
+
+from marrow.wsgi.objects.response import Response, FLUSH
+
+
+def chatty(count=10000):
+    for i in range(count):
+        yield 'x'
+
+
+class TestCoalesce(TestCase):
+    def test_disabled(self):
+        body = chatty()
+        
+        self.assertTrue(Response(dict(), body=body).wsgi.body is body)
+    
+    def test_threshold(self):
+        body = list(Response(dict(), body=chatty(), coalesce=4096).wsgi.body)
+        
+        self.assertEquals([4096, 4096, 1808], [len(i) for i in body])
+        self.assertEquals(b'x' * 10000, b''.join(body))
+    
+    def test_encoding(self):
+        def generator():
+            yield '☃'
+            yield b'!'
+        
+        response = Response(dict(), body=generator(), coalesce=1024, encoding='utf-8')
+        
+        self.assertEquals(['☃!'.encode('utf-8')], list(response.wsgi.body))
+    
+    def test_flush(self):
+        def generator():
+            yield 'Loading...'
+            yield FLUSH
+            yield FLUSH
+            yield 'done.'
+        
+        body = Response(dict(), body=generator(), coalesce=1024).wsgi.body
+        
+        self.assertEquals([b'Loading...', b'done.'], list(body))
+    
+    def test_close(self):
+        body = chatty()
+        list(Response(dict(), body=body, coalesce=1024).wsgi.body)
+        
+        self.assertRaises(StopIteration, next, body)
+    
+    def test_compressed(self):
+        response = Response(dict(HTTP_ACCEPT_ENCODING='gzip'), body=chatty(), coalesce=4096, compress=True)
+        body = response.wsgi.body
+        
+        self.assertEquals(b'x' * 10000, zlib.decompress(b''.join(body), 16 + zlib.MAX_WBITS))
@@ -0,0 +1,177 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+import zlib
+
+from marrow.util.compat import IO
+
+from marrow.wsgi.objects.compression import negotiate, compressible
+from marrow.wsgi.objects.response import Response, FLUSH
+
+
+TEXT = b'The quick brown fox jumps over the lazy dog. ' * 100
+
+
+def decompress(body, coding='gzip'):
+    return zlib.decompress(b''.join(body), 16 + zlib.MAX_WBITS if coding == 'gzip' else zlib.MAX_WBITS)
+
+
+class TestNegotiation(TestCase):
+    def test_missing(self):
+        self.assertEquals(None, negotiate(None))
+        self.assertEquals(None, negotiate(''))
+    
+    def test_preference(self):
+        self.assertEquals('gzip', negotiate('gzip, deflate'))
+        self.assertEquals('gzip', negotiate('deflate, gzip'))
+        self.assertEquals('deflate', negotiate('deflate'))
+        self.assertEquals('gzip', negotiate('x-gzip'))
+    
+    def test_quality(self):
+        self.assertEquals('deflate', negotiate('gzip;q=0.5, deflate'))
+        self.assertEquals('deflate', negotiate('gzip;q=0, deflate;q=0.1'))
+        self.assertEquals(None, negotiate('gzip;q=0, deflate;q=0'))
+        self.assertEquals(None, negotiate('identity'))
+    
+    def test_wildcard(self):
+        self.assertEquals('gzip', negotiate('*'))
+        self.assertEquals('deflate', negotiate('gzip;q=0, *'))
+        self.assertEquals(None, negotiate('*;q=0'))
+    
+    def test_compressible(self):
+        self.assertTrue(compressible('text/html; charset=utf-8'))
+        self.assertTrue(compressible('application/json'))
+        self.assertTrue(compressible('application/vnd.api+json'))
+        self.assertFalse(compressible('image/png'))
+        self.assertFalse(compressible('application/zip'))
+        self.assertFalse(compressible(None))
+
+
+class TestCompression(TestCase):
+    def response(self, body, accept='gzip, deflate', **kw):
+        return Response(dict(HTTP_ACCEPT_ENCODING=accept), body=body, compress=True, **kw)
+    
+    def test_disabled(self):
+        response = Response(dict(HTTP_ACCEPT_ENCODING='gzip'), body=TEXT)
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([TEXT], body)
+        self.assertFalse(b'Content-Encoding' in dict(headers))
+    
+    def test_bytes(self):
+        response = self.response(TEXT)
+        status, headers, body = response.wsgi
+        headers = dict(headers)
+        
+        self.assertEquals(1, len(body))
+        self.assertEquals(TEXT, decompress(body))
+        self.assertEquals(b'gzip', headers[b'Content-Encoding'])
+        self.assertEquals(b'Accept-Encoding', headers[b'Vary'])
+        self.assertEquals(str(len(body[0])).encode('ascii'), headers[b'Content-Length'])
+        self.assertTrue(len(body[0]) < len(TEXT))
+    
+    def test_deflate(self):
+        response = self.response(TEXT.decode('ascii'), accept='deflate')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'deflate', dict(headers)[b'Content-Encoding'])
+        self.assertEquals(TEXT, decompress(body, 'deflate'))
+    
+    def test_iterable(self):
+        def generator():
+            for i in range(10):
+                yield TEXT
+        
+        response = self.response(generator(), length=len(TEXT) * 10)
+        status, headers, body = response.wsgi
+        
+        self.assertFalse(b'Content-Length' in dict(headers))
+        self.assertEquals(TEXT * 10, decompress(body))
+    
+    def test_file(self):
+        response = self.response(IO(TEXT), block_size=256)
+        status, headers, body = response.wsgi
+        
+        self.assertFalse(b'Content-Length' in dict(headers))
+        self.assertEquals(TEXT, decompress(body))
+    
+    def test_not_accepted(self):
+        response = self.response(TEXT, accept='identity')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([TEXT], body)
+        self.assertEquals(b'Accept-Encoding', dict(headers)[b'Vary'])
+    
+    def test_not_eligible(self):
+        response = self.response(TEXT, mime='image/png', accept='identity')
+        status, headers, body = response.wsgi
+        
+        self.assertFalse(b'Vary' in dict(headers))
+    
+    def test_flush(self):
+        def generator():
+            yield b'Hello. '
+            yield FLUSH
+            yield b'Goodbye.'
+        
+        response = self.response(generator(), coalesce=4096)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        received = b''
+        body = iter(response.wsgi.body)
+        
+        for chunk in body:
+            received += decoder.decompress(chunk)
+            
+            if received:
+                break
+        
+        self.assertEquals(b'Hello. ', received)
+        self.assertEquals(b'Hello. Goodbye.', received + decoder.decompress(b''.join(body)))
+    
+    def test_small(self):
+        response = self.response(b'Hello world!')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([b'Hello world!'], body)
+    
+    def test_already_compressed(self):
+        response = self.response(TEXT, mime='image/png')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([TEXT], body)
+        
+        response = self.response(TEXT)
+        response['Content-Encoding'] = 'br'
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([TEXT], body)
+    
+    def test_vary(self):
+        response = self.response(TEXT)
+        response['Vary'] = 'Cookie'
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'Cookie, Accept-Encoding', dict(headers)[b'Vary'])
+    
+    def test_repeated(self):
+        response = self.response(TEXT)
+        first = response.wsgi
+        second = response.wsgi
+        
+        self.assertEquals(first.headers, second.headers)
+        self.assertEquals(TEXT, decompress(second.body))
+        self.assertRaises(KeyError, lambda: response['Content-Encoding'])
+    
+    def test_level(self):
+        fast = self.response(TEXT, compress_level=1).wsgi.body[0]
+        best = self.response(TEXT, compress_level=9).wsgi.body[0]
+        
+        self.assertEquals(TEXT, decompress([fast]))
+        self.assertEquals(TEXT, decompress([best]))
+        self.assertTrue(len(best) <= len(fast))
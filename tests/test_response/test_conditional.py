@@ -0,0 +1,125 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from tempfile import NamedTemporaryFile
+
+from marrow.wsgi.objects.conditional import strong, matches
+from marrow.wsgi.objects.response import Response
+
+
+class TestHelpers(TestCase):
+    def test_strong(self):
+        self.assertEquals(strong([b'Hello ', b'world!']), strong([b'Hello world!']))
+        self.assertNotEqual(strong([b'Hello world!']), strong([b'Hello world?']))
+    
+    def test_matches(self):
+        self.assertTrue(matches('"foo"', '"foo"'))
+        self.assertTrue(matches('"bar", "foo"', '"foo"'))
+        self.assertTrue(matches('W/"foo"', '"foo"'))
+        self.assertTrue(matches('"foo"', 'W/"foo"'))
+        self.assertTrue(matches('*', '"foo"'))
+        self.assertFalse(matches('"bar"', '"foo"'))
+        self.assertFalse(matches('"foo"', None))
+        self.assertFalse(matches(None, '"foo"'))
+
+
+class TestConditional(TestCase):
+    def response(self, body=b'Hello world!', **environ):
+        environ.setdefault('REQUEST_METHOD', 'GET')
+        return Response(environ, body=body, conditional=True)
+    
+    def test_generated(self):
+        response = self.response()
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'200 OK', status)
+        self.assertEquals(strong([b'Hello world!']).encode('ascii'), dict(headers)[b'ETag'])
+        self.assertEquals([b'Hello world!'], body)
+    
+    def test_unicode_chunks(self):
+        response = self.response(['Hello ', 'world!'])
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(strong([b'Hello ', b'world!']).encode('ascii'), dict(headers)[b'ETag'])
+    
+    def test_not_modified(self):
+        etag = strong([b'Hello world!'])
+        response = self.response(HTTP_IF_NONE_MATCH=etag)
+        response['Cache-Control'] = 'max-age=60'
+        status, headers, body = response.wsgi
+        headers = dict(headers)
+        
+        self.assertEquals(b'304 Not Modified', status)
+        self.assertEquals([b''], body)
+        self.assertEquals(etag.encode('ascii'), headers[b'ETag'])
+        self.assertEquals(b'max-age=60', headers[b'Cache-Control'])
+        self.assertFalse(b'Content-Type' in headers)
+    
+    def test_changed(self):
+        response = self.response(HTTP_IF_NONE_MATCH='"stale"')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'200 OK', status)
+    
+    def test_supplied(self):
+        def generator():
+            raise AssertionError("Body should not be generated.")
+            yield b''
+        
+        response = self.response(generator(), HTTP_IF_NONE_MATCH='"v1"')
+        response.etag = 'v1'
+        
+        self.assertEquals(b'"v1"', response.etag)
+        self.assertTrue(response.fresh)
+        self.assertEquals(b'304 Not Modified', response.wsgi.status)
+    
+    def test_modified_since(self):
+        response = self.response(HTTP_IF_MODIFIED_SINCE='Sun, 06 Nov 1994 08:49:37 GMT')
+        response.modified = 'Sun, 06 Nov 1994 08:49:37 GMT'
+        self.assertEquals(b'304 Not Modified', response.wsgi.status)
+        
+        response = self.response(HTTP_IF_MODIFIED_SINCE='Sun, 06 Nov 1994 08:49:37 GMT')
+        response.modified = 'Mon, 07 Nov 1994 08:49:37 GMT'
+        self.assertEquals(b'200 OK', response.wsgi.status)
+    
+    def test_none_match_precedence(self):
+        response = self.response(HTTP_IF_NONE_MATCH='"stale"', HTTP_IF_MODIFIED_SINCE='Sun, 06 Nov 1994 08:49:37 GMT')
+        response.modified = 'Sun, 06 Nov 1994 08:49:37 GMT'
+        
+        self.assertEquals(b'200 OK', response.wsgi.status)
+    
+    def test_unsafe_method(self):
+        etag = strong([b'Hello world!'])
+        response = self.response(HTTP_IF_NONE_MATCH=etag, REQUEST_METHOD='POST')
+        
+        self.assertEquals(b'200 OK', response.wsgi.status)
+    
+    def test_file(self):
+        with NamedTemporaryFile() as handle:
+            handle.write(b'x' * 1000)
+            handle.flush()
+            
+            source = open(handle.name, 'rb')
+            response = self.response(source)
+            etag = dict(response.wsgi.headers)[b'ETag']
+            source.close()
+            
+            self.assertTrue(etag.startswith(b'W/"'))
+            
+            source = open(handle.name, 'rb')
+            response = self.response(source, HTTP_IF_NONE_MATCH=etag.decode('ascii'))
+            
+            self.assertEquals(b'304 Not Modified', response.wsgi.status)
+            self.assertTrue(source.closed)
+    
+    def test_disabled(self):
+        response = Response(dict(HTTP_IF_NONE_MATCH='*'), body=b'Hello world!')
+        
+        self.assertEquals(b'200 OK', response.wsgi.status)
+        self.assertEquals(None, response.etag)
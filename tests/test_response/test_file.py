@@ -0,0 +1,68 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from tempfile import TemporaryFile
+
+from marrow.util.compat import IO
+
+from marrow.wsgi.objects.response import Response
+
+
+class FileWrapper(object):
+    def __init__(self, filelike, block_size):
+        self.filelike = filelike
+        self.block_size = block_size
+
+
+class TestFileBody(TestCase):
+    def setUp(self):
+        self.file = TemporaryFile()
+        self.file.write(b'x' * 100000)
+        self.file.seek(0)
+    
+    def tearDown(self):
+        self.file.close()
+    
+    def test_in_memory(self):
+        response = Response(dict(), body=IO(b'y' * 1000), block_size=256)
+        status, headers, body = response.wsgi
+        
+        self.assertEquals([256, 256, 256, 232], [len(i) for i in body])
+        self.assertEquals(b'1000', dict(headers)[b'Content-Length'])
+    
+    def test_iteration(self):
+        response = Response(dict(), body=self.file)
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'100000', dict((n.lower(), v) for n, v in headers)[b'content-length'])
+        self.assertEquals(b'x' * 100000, b''.join(body))
+        self.assertTrue(self.file.closed)
+    
+    def test_partially_read(self):
+        self.file.seek(1000)
+        
+        response = Response(dict(), body=self.file)
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'99000', dict(headers)[b'Content-Length'])
+    
+    def test_explicit_length(self):
+        response = Response(dict(), body=self.file, length=27)
+        response.wsgi
+        
+        self.assertEquals(27, response.length)
+    
+    def test_file_wrapper(self):
+        response = Response({'wsgi.file_wrapper': FileWrapper}, body=self.file)
+        status, headers, body = response.wsgi
+        
+        self.assertIsInstance(body, FileWrapper)
+        self.assertTrue(body.filelike is self.file)
+        self.assertEquals(Response.block_size, body.block_size)
+        self.assertEquals(b'100000', dict(headers)[b'Content-Length'])
@@ -0,0 +1,61 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.response import Response
+
+
+class TestFinalResponse(TestCase):
+    def setUp(self):
+        self.response = Response(dict(), status=404, mime='text/plain', body=iter(["Not ", "Found"]))
+        self.response.final = True
+    
+    def test_serialized(self):
+        status, headers, body = self.response.wsgi
+        
+        self.assertEquals(b'404 Not Found', status)
+        self.assertEquals((b'Not Found', ), body)
+        self.assertEquals(b'9', dict((n.lower(), v) for n, v in headers)[b'content-length'])
+    
+    def test_reused(self):
+        first, second = self.response.wsgi, self.response.wsgi
+        
+        self.assertTrue(first.status is second.status)
+        self.assertTrue(first.body is second.body)
+        self.assertEquals(first.headers, second.headers)
+        self.assertFalse(first.headers is second.headers)
+    
+    def test_call(self):
+        self.assertEquals(self.response.wsgi, self.response())
+        
+        collected = []
+        self.assertEquals((b'Not Found', ), self.response(dict(), lambda *args: collected.append(args)))
+        self.assertEquals(b'404 Not Found', collected[0][0])
+    
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.response.status = 200
+        
+        with self.assertRaises(AttributeError):
+            self.response.body = b"Changed"
+        
+        with self.assertRaises(AttributeError):
+            self.response.mime = "text/html"
+        
+        with self.assertRaises(AttributeError):
+            self.response['X-Foo'] = "bar"
+        
+        with self.assertRaises(AttributeError):
+            del self.response['Content-Type']
+    
+    def test_permanent(self):
+        self.response.final = False
+        self.assertTrue(self.response.final)
+        
+        del self.response.final
+        self.assertTrue(self.response.final)
@@ -0,0 +1,83 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.headers import Headers
+from marrow.wsgi.objects.response import Response
+
+
+class TestHeaders(TestCase):
+    def setUp(self):
+        self.headers = Headers([('Content-Type', 'text/plain'), (b'X-Foo', b'bar')])
+    
+    def test_storage(self):
+        self.assertEquals([(b'Content-Type', b'text/plain'), (b'X-Foo', b'bar')], self.headers.pairs)
+    
+    def test_case_insensitive(self):
+        self.assertEquals(b'text/plain', self.headers['content-type'])
+        self.assertEquals(b'text/plain', self.headers[b'CONTENT-TYPE'])
+        self.assertTrue('x-foo' in self.headers)
+        self.assertFalse('X-Bar' in self.headers)
+        self.assertRaises(KeyError, lambda: self.headers['X-Bar'])
+    
+    def test_replace(self):
+        self.headers['content-type'] = 'text/html'
+        
+        self.assertEquals([(b'content-type', b'text/html'), (b'X-Foo', b'bar')], self.headers.pairs)
+    
+    def test_multiple(self):
+        self.headers.add('Set-Cookie', 'a=1')
+        self.headers.add('Set-Cookie', 'b=2')
+        
+        self.assertEquals(4, len(self.headers))
+        self.assertEquals(b'a=1', self.headers['Set-Cookie'])
+        self.assertEquals([b'a=1', b'b=2'], self.headers.getall('set-cookie'))
+        self.assertEquals([b'Content-Type', b'X-Foo', b'Set-Cookie'], list(self.headers))
+        
+        self.headers['Set-Cookie'] = 'c=3'
+        self.assertEquals([b'c=3'], self.headers.getall('Set-Cookie'))
+        self.assertEquals(3, len(self.headers))
+    
+    def test_delete(self):
+        self.headers.add('Set-Cookie', 'a=1')
+        self.headers.add('X-Foo', 'baz')
+        del self.headers['x-foo']
+        
+        self.assertEquals([(b'Content-Type', b'text/plain'), (b'Set-Cookie', b'a=1')], self.headers.pairs)
+        self.assertEquals(b'a=1', self.headers['Set-Cookie'])
+        
+        with self.assertRaises(KeyError):
+            del self.headers['X-Foo']
+    
+    def test_get(self):
+        self.assertEquals(b'bar', self.headers.get('X-Foo'))
+        self.assertEquals(None, self.headers.get('X-Bar'))
+        self.assertEquals(b'bar', self.headers.pop('X-Foo'))
+        self.assertEquals(None, self.headers.pop('X-Foo'))
+    
+    def test_encoding(self):
+        self.headers['X-Count'] = 27
+        self.headers['X-Snowman'] = '☃'
+        
+        self.assertEquals(b'27', self.headers['X-Count'])
+        self.assertEquals('☃'.encode('utf-8'), self.headers['X-Snowman'])
+
+
+class TestResponseHeaders(TestCase):
+    def test_direct(self):
+        response = Response(dict(), body=b'Hello world!')
+        response.headers.add('Set-Cookie', 'a=1')
+        response.headers.add('Set-Cookie', 'b=2')
+        status, headers, body = response.wsgi
+        
+        self.assertFalse(headers is response.headers.pairs)
+        self.assertRaises(KeyError, lambda: response['Content-Length'])
+        
+        headers.append((b'X-Server', b'appended'))
+        self.assertRaises(KeyError, lambda: response['X-Server'])
+        self.assertEquals([(b'Set-Cookie', b'a=1'), (b'Set-Cookie', b'b=2')], [i for i in headers if i[0] == b'Set-Cookie'])
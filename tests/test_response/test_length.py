@@ -0,0 +1,57 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from io import BytesIO
+from tempfile import TemporaryFile
+
+from marrow.wsgi.objects.response import Response
+
+
+class TestLength(TestCase):
+    def length(self, body, **kw):
+        response = Response(dict(), body=body, **kw)
+        status, headers, body = response.wsgi
+        length = dict(headers).get(b'Content-Length', None)
+        return None if length is None else int(length)
+    
+    def test_binary(self):
+        self.assertEquals(12, self.length(b'Hello world!'))
+    
+    def test_unicode(self):
+        self.assertEquals(3, self.length('☃', encoding='utf-8'))
+    
+    def test_chunks(self):
+        self.assertEquals(12, self.length([b'Hello', b' ', b'world!']))
+        self.assertEquals(12, self.length((b'Hello', b' ', b'world!')))
+        self.assertEquals(None, self.length(['Hello', ' ', 'world!']))
+    
+    def test_file(self):
+        with TemporaryFile() as handle:
+            handle.write(b'x' * 1000)
+            handle.seek(100)
+            
+            self.assertEquals(900, self.length(handle))
+    
+    def test_buffer(self):
+        body = BytesIO(b'x' * 1000)
+        body.seek(10)
+        
+        self.assertEquals(990, self.length(body))
+    
+    def test_generator(self):
+        def generator():
+            yield b'Hello world!'
+        
+        self.assertEquals(None, self.length(generator()))
+    
+    def test_supplied(self):
+        self.assertEquals(5, self.length(b'Hello world!', length=5))
+    
+    def test_no_content(self):
+        self.assertEquals(None, self.length(b'', status=204))
@@ -0,0 +1,140 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from tempfile import TemporaryFile
+
+from marrow.wsgi.objects.response import Response
+
+
+DATA = bytes(bytearray(range(256))) * 4
+
+
+class TestRange(TestCase):
+    def setUp(self):
+        self.file = TemporaryFile()
+        self.file.write(DATA)
+        self.file.seek(0)
+    
+    def tearDown(self):
+        self.file.close()
+    
+    def response(self, body, **environ):
+        environ.setdefault('REQUEST_METHOD', 'GET')
+        return Response(environ, body=body, ranged=True, mime='application/octet-stream')
+    
+    def test_none(self):
+        response = self.response(self.file)
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'200 OK', status)
+        self.assertEquals(b'bytes', dict(headers)[b'Accept-Ranges'])
+        self.assertEquals(DATA, b''.join(body))
+    
+    def test_repeated(self):
+        response = self.response(DATA, HTTP_RANGE='bytes=100-199')
+        response.wsgi
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'206 Partial Content', status)
+        self.assertEquals(b'bytes 100-199/1024', dict(headers)[b'Content-Range'])
+        self.assertEquals(DATA[100:200], b''.join(body))
+        self.assertEquals(b'200 OK', response.status.binary)
+    
+    def test_unicode_chunks(self):
+        response = self.response(['Hello ', 'w\xf6rld!'], HTTP_RANGE='bytes=6-')
+        response.encoding = 'utf-8'
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'206 Partial Content', status)
+        self.assertEquals('w\xf6rld!'.encode('utf-8'), b''.join(body))
+    
+    def test_single(self):
+        response = self.response(self.file, HTTP_RANGE='bytes=100-199')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'206 Partial Content', status)
+        headers = dict(headers)
+        
+        self.assertEquals(b'206 Partial Content', status)
+        self.assertEquals(b'bytes 100-199/1024', headers[b'Content-Range'])
+        self.assertEquals(b'100', headers[b'Content-Length'])
+        self.assertEquals(DATA[100:200], b''.join(body))
+        self.assertTrue(self.file.closed)
+    
+    def test_suffix(self):
+        response = self.response(DATA, HTTP_RANGE='bytes=-24')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'bytes 1000-1023/1024', dict(headers)[b'Content-Range'])
+        self.assertEquals([DATA[-24:]], body)
+    
+    def test_offset(self):
+        self.file.seek(24)
+        response = self.response(self.file, HTTP_RANGE='bytes=0-9')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'bytes 0-9/1000', dict(headers)[b'Content-Range'])
+        self.assertEquals(DATA[24:34], b''.join(body))
+    
+    def test_multiple(self):
+        response = self.response(self.file, HTTP_RANGE='bytes=0-9,1000-')
+        status, headers, body = response.wsgi
+        body = b''.join(body)
+        headers = dict(headers)
+        
+        self.assertEquals(b'206 Partial Content', status)
+        
+        mime, _, boundary = headers[b'Content-Type'].partition(b'; boundary=')
+        
+        self.assertEquals(b'multipart/byteranges', mime)
+        self.assertEquals(str(len(body)).encode('ascii'), headers[b'Content-Length'])
+        self.assertEquals(
+                b'--' + boundary + b'\r\nContent-Type: application/octet-stream; charset=utf-8\r\nContent-Range: bytes 0-9/1024\r\n\r\n' +
+                DATA[:10] + b'\r\n--' + boundary +
+                b'\r\nContent-Type: application/octet-stream; charset=utf-8\r\nContent-Range: bytes 1000-1023/1024\r\n\r\n' +
+                DATA[1000:] + b'\r\n--' + boundary + b'--\r\n',
+                body
+            )
+        
+        memory = self.response(DATA, HTTP_RANGE='bytes=0-9,1000-')
+        self.assertEquals(headers[b'Content-Length'], dict(memory.wsgi.headers)[b'Content-Length'])
+    
+    def test_unsatisfiable(self):
+        response = self.response(self.file, HTTP_RANGE='bytes=2000-')
+        status, headers, body = response.wsgi
+        
+        self.assertEquals(b'416 Requested Range Not Satisfiable', status)
+        self.assertEquals(b'bytes */1024', dict(headers)[b'Content-Range'])
+        self.assertTrue(self.file.closed)
+    
+    def test_if_range(self):
+        response = self.response(DATA, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"v1"')
+        response.etag = 'v1'
+        self.assertEquals(b'206 Partial Content', response.wsgi.status)
+        
+        response = self.response(DATA, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"v0"')
+        response.etag = 'v1'
+        self.assertEquals(b'200 OK', response.wsgi.status)
+        
+        response = self.response(DATA, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='Sun, 06 Nov 1994 08:49:37 GMT')
+        response.modified = 'Sun, 06 Nov 1994 08:49:37 GMT'
+        self.assertEquals(b'206 Partial Content', response.wsgi.status)
+        
+        response = self.response(DATA, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertEquals(b'200 OK', response.wsgi.status)
+    
+    def test_disabled(self):
+        response = Response(dict(REQUEST_METHOD='GET', HTTP_RANGE='bytes=0-9'), body=DATA)
+        
+        self.assertEquals(b'200 OK', response.wsgi.status)
+    
+    def test_too_many(self):
+        response = self.response(DATA, HTTP_RANGE='bytes=' + ','.join('%d-%d' % (i, i) for i in range(20)))
+        
+        self.assertEquals(b'200 OK', response.wsgi.status)
@@ -0,0 +1,95 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals, division, print_function, absolute_import
+
+try:  # This to handle Python 2.6 which is missing a lot.
+    from unittest2 import TestCase
+except ImportError:
+    from unittest import TestCase
+
+from marrow.wsgi.objects.request import LocalRequest
+from marrow.wsgi.objects.routing import Router
+
+
+class TestRouter(TestCase):
+    def setUp(self):
+        self.router = Router([
+                ('/', 'root'),
+                ('/users', 'list'),
+                ('/users/new', 'new'),
+                ('/users/{id}', 'show'),
+                ('/users/{id}/edit', 'edit'),
+                ('/static/*', 'static'),
+                ('/archive/{}/{}', 'archive'),
+            ])
+    
+    def route(self, path, **kw):
+        request = LocalRequest(path=path, **kw)
+        return request, self.router.route(request)
+    
+    def test_root(self):
+        request, target = self.route('/')
+        self.assertEquals('root', target)
+        self.assertEquals('', request['SCRIPT_NAME'])
+        self.assertEquals('/', request['PATH_INFO'])
+    
+    def test_literal(self):
+        request, target = self.route('/users')
+        self.assertEquals('list', target)
+        self.assertEquals('/users', request['SCRIPT_NAME'])
+        self.assertEquals('', request['PATH_INFO'])
+        self.assertEquals(((), dict()), request['wsgiorg.routing_args'])
+    
+    def test_trailing_slash(self):
+        request, target = self.route('/users/')
+        self.assertEquals('list', target)
+        self.assertEquals('/users', request['SCRIPT_NAME'])
+        self.assertEquals('/', request['PATH_INFO'])
+    
+    def test_literal_preferred(self):
+        self.assertEquals('new', self.route('/users/new')[1])
+    
+    def test_capture(self):
+        request, target = self.route('/users/42/edit')
+        self.assertEquals('edit', target)
+        self.assertEquals('/users/42/edit', request['SCRIPT_NAME'])
+        self.assertEquals(((), dict(id='42')), request['wsgiorg.routing_args'])
+    
+    def test_positional(self):
+        request, target = self.route('/archive/2012/07')
+        self.assertEquals('archive', target)
+        self.assertEquals((('2012', '07'), dict()), request['wsgiorg.routing_args'])
+    
+    def test_wildcard(self):
+        request, target = self.route('/static/css/site.css')
+        self.assertEquals('static', target)
+        self.assertEquals('/static', request['SCRIPT_NAME'])
+        self.assertEquals('/css/site.css', request['PATH_INFO'])
+    
+    def test_script_name(self):
+        request, target = self.route('/users/42', environ=dict(SCRIPT_NAME='/app'))
+        self.assertEquals('show', target)
+        self.assertEquals('/app/users/42', request['SCRIPT_NAME'])
+    
+    def test_existing_args(self):
+        request, target = self.route('/users/42', environ={'wsgiorg.routing_args': (('x', ), dict(y='z'))})
+        self.assertEquals((('x', ), dict(id='42', y='z')), request['wsgiorg.routing_args'])
+    
+    def test_no_match(self):
+        request, target = self.route('/users/42/delete')
+        self.assertEquals(None, target)
+        self.assertEquals('/users/42/delete', request['PATH_INFO'])
+        self.assertNotIn('wsgiorg.routing_args', request.environ)
+    
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.router.add('/foo/*/bar', None)
+        
+        with self.assertRaises(ValueError):
+            self.router.add('/users/{name}', None)
+    
+    def test_wsgi(self):
+        router = Router({'/hello': lambda environ, start_response: (b'200 OK', [], [b'hi'])})
+        
+        self.assertEquals((b'200 OK', [], [b'hi']), router(LocalRequest(path='/hello').environ))
+        self.assertEquals(b'404 Not Found', router(LocalRequest(path='/nope').environ)[0])